@@ -2,10 +2,19 @@
 
 import json
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict
 
 
+# Names of the cached_property accessors, cleared on config changes
+_CACHED_PROPERTIES = (
+    'pki_dir', 'easyrsa_bin', 'usb_mount_points', 'template_dir',
+    'window_width', 'window_height', 'fullscreen',
+    'content_width', 'button_width', 'button_height', 'button_spacing'
+)
+
+
 class Settings:
     """Application settings manager."""
 
@@ -16,6 +25,7 @@ class Settings:
             config_file: Path to custom config file. If None, uses defaults.json
         """
         self._config = {}
+        self._cache: Dict[str, Any] = {}
         self._load_defaults()
 
         if config_file and os.path.exists(config_file):
@@ -36,6 +46,7 @@ class Settings:
         with open(config_file, 'r') as f:
             custom_config = json.load(f)
             self._config.update(custom_config)
+        self.invalidate_cache()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value.
@@ -47,15 +58,21 @@ class Settings:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
+        # Dotted-path lookups are hot in UI layout code; memoize resolved keys
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
         value = self._config
 
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
                 return default
 
+        self._cache[key] = value
         return value
 
     def set(self, key: str, value: Any):
@@ -74,6 +91,13 @@ class Settings:
             config = config[k]
 
         config[keys[-1]] = value
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Drop memoized lookups and cached property values."""
+        self._cache.clear()
+        for attr in _CACHED_PROPERTIES:
+            self.__dict__.pop(attr, None)
 
     def save(self, config_file: str):
         """Save current configuration to file.
@@ -84,57 +108,57 @@ class Settings:
         with open(config_file, 'w') as f:
             json.dump(self._config, f, indent=2)
 
-    @property
+    @cached_property
     def pki_dir(self) -> str:
         """Get PKI directory path."""
         return self.get('pki_dir', '/home/pi/easy-rsa-pki')
 
-    @property
+    @cached_property
     def easyrsa_bin(self) -> str:
         """Get easy-rsa binary path."""
         return self.get('easyrsa_bin', '/usr/share/easy-rsa/easyrsa')
 
-    @property
+    @cached_property
     def usb_mount_points(self) -> list:
         """Get USB mount points to monitor."""
         return self.get('usb_mount_points', ['/media/pi', '/mnt/usb'])
 
-    @property
+    @cached_property
     def template_dir(self) -> str:
         """Get template directory path."""
         return self.get('template_dir', 'templates/vars')
 
-    @property
+    @cached_property
     def window_width(self) -> int:
         """Get window width."""
         return self.get('window.width', 480)
 
-    @property
+    @cached_property
     def window_height(self) -> int:
         """Get window height."""
         return self.get('window.height', 320)
 
-    @property
+    @cached_property
     def fullscreen(self) -> bool:
         """Get fullscreen mode setting."""
         return self.get('window.fullscreen', True)
 
-    @property
+    @cached_property
     def content_width(self) -> int:
         """Get content area width."""
         return self.get('layout.content_width', 360)
 
-    @property
+    @cached_property
     def button_width(self) -> int:
         """Get button area width."""
         return self.get('layout.button_width', 120)
 
-    @property
+    @cached_property
     def button_height(self) -> int:
         """Get button height."""
         return self.get('layout.button_height', 40)
 
-    @property
+    @cached_property
     def button_spacing(self) -> int:
         """Get button spacing."""
         return self.get('layout.button_spacing', 10)
@@ -1,6 +1,7 @@
 """Data models for easy-rsa certificates and PKI structures."""
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 from enum import Enum
@@ -20,7 +21,7 @@ class CertificateType(Enum):
     CLIENT = 'client'
 
 
-@dataclass
+@dataclass(slots=True)
 class Certificate:
     """Certificate information."""
     status: CertificateStatus
@@ -30,38 +31,62 @@ class Certificate:
     filename: str
     common_name: str
     cert_type: Optional[CertificateType] = None
+    _display_label: Optional[str] = field(default=None, repr=False, compare=False)
 
-    def is_valid(self) -> bool:
+    @property
+    def display_label(self) -> str:
+        """Menu label ('✓ name' / '✗ name'), formatted once per certificate.
+
+        Certificates outlive the menus that show them (the list is
+        mtime-cached), so the label is memoized rather than re-built on
+        every menu rebuild.
+        """
+        label = self._display_label
+        if label is None:
+            icon = '✓' if self.status == CertificateStatus.VALID else '✗'
+            label = f'{icon} {self.common_name}'
+            self._display_label = label
+        return label
+
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
         """Check if certificate is valid.
 
+        Args:
+            now: Reference time; callers checking many certificates
+                should capture datetime.now() once and pass it in
+
         Returns:
             True if certificate is valid and not expired
         """
         if self.status != CertificateStatus.VALID:
             return False
-        if self.expiration_date < datetime.now():
+        if self.expiration_date < (now or datetime.now()):
             return False
         return True
 
-    def days_until_expiration(self) -> int:
+    def days_until_expiration(self, now: Optional[datetime] = None) -> int:
         """Get days until expiration.
 
+        Args:
+            now: Reference time (default: datetime.now())
+
         Returns:
             Number of days until expiration (negative if expired)
         """
-        delta = self.expiration_date - datetime.now()
+        delta = self.expiration_date - (now or datetime.now())
         return delta.days
 
     def __str__(self) -> str:
         """String representation."""
+        now = datetime.now()
         status_str = self.status.name
-        if self.is_valid():
-            days = self.days_until_expiration()
+        if self.is_valid(now):
+            days = self.days_until_expiration(now)
             status_str += f' ({days} days left)'
         return f'{self.common_name} - {status_str}'
 
 
-@dataclass
+@dataclass(slots=True)
 class PKIInfo:
     """PKI directory information."""
     pki_dir: str
@@ -74,6 +99,11 @@ class PKIInfo:
     revoked_dir: str
     index_file: str
     serial_file: str
+    # Display-friendly directory names, fixed at construction so views
+    # don't re-run os.path.basename on paths that never change
+    issued_basename: str = ''
+    private_basename: str = ''
+    reqs_basename: str = ''
 
     def is_initialized(self) -> bool:
         """Check if PKI is properly initialized.
@@ -81,7 +111,6 @@ class PKIInfo:
         Returns:
             True if PKI directory structure exists
         """
-        import os
         # init-pki creates pki_dir with private/ and reqs/ subdirectories
         # index.txt is only created later by build-ca
         return (os.path.exists(self.pki_dir) and
@@ -94,7 +123,6 @@ class PKIInfo:
         Returns:
             True if CA certificate and key exist
         """
-        import os
         if not self.ca_exists:
             return False
         if not self.ca_cert_path or not self.ca_key_path:
@@ -102,7 +130,7 @@ class PKIInfo:
         return os.path.exists(self.ca_cert_path) and os.path.exists(self.ca_key_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Result from running an easy-rsa command."""
     success: bool
@@ -135,7 +163,7 @@ class CommandResult:
         return '\n'.join(output)
 
 
-@dataclass
+@dataclass(slots=True)
 class CertificateRequest:
     """Certificate signing request information."""
     name: str
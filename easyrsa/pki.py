@@ -1,12 +1,23 @@
 """PKI directory structure management."""
 
 import os
+import shutil
+from collections import Counter
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from easyrsa.models import PKIInfo, Certificate, CertificateStatus
 from easyrsa.parser import EasyRSAParser
 from config.settings import settings
 
+# Optional: in-process X.509 parsing for metadata reads. Parsing a PEM
+# with cryptography takes microseconds where a show-cert subprocess
+# takes hundreds of ms on the Pi; subprocess calls stay reserved for
+# mutating operations (sign, revoke, gen-crl).
+try:
+    from cryptography import x509
+except ImportError:
+    x509 = None
+
 
 class PKIManager:
     """Manager for PKI directory structure."""
@@ -19,12 +30,63 @@ class PKIManager:
         """
         self.pki_dir = pki_dir or settings.pki_dir
 
+        # Pre-computed subdirectory paths (avoid re-Path()ing per lookup)
+        pki_path = Path(self.pki_dir)
+        self._issued_dir = pki_path / 'issued'
+        self._private_dir = pki_path / 'private'
+        self._reqs_dir = pki_path / 'reqs'
+
+        # PKIInfo cache, invalidated when the PKI directory mtime changes
+        self._pki_info_cache: Optional[PKIInfo] = None
+        self._pki_info_mtime: Optional[float] = None
+
+        # Parsed index.txt cache, invalidated when index.txt mtime changes.
+        # Size/complete track how far the file has been parsed so pure
+        # appends (new cert issued) only parse the tail.
+        self._cert_cache: Optional[List[Certificate]] = None
+        self._cert_index: Dict[str, Certificate] = {}
+        self._cert_cache_mtime: Optional[float] = None
+        self._cert_cache_size: int = 0
+        self._cert_cache_complete: bool = False
+        # Bumped whenever the cached certificate contents change (full
+        # re-parse, tail append, invalidation); screens compare it to
+        # decide whether their menus are stale
+        self._cert_version: int = 0
+
+    def invalidate(self):
+        """Drop all cached PKI state.
+
+        The mtime keys catch most changes on their own; call this after
+        operations that rewrite the PKI wholesale (init-pki, build-ca) so
+        stale data can't survive a same-second mtime.
+        """
+        self._pki_info_cache = None
+        self._pki_info_mtime = None
+        self._cert_cache = None
+        self._cert_index = {}
+        self._cert_cache_mtime = None
+        self._cert_cache_size = 0
+        self._cert_cache_complete = False
+        self._cert_version += 1
+
     def get_pki_info(self) -> PKIInfo:
         """Get PKI directory information.
 
+        The result is cached and rebuilt only when the PKI directory's
+        mtime changes, so repeated calls avoid per-call stat storms.
+
         Returns:
             PKIInfo object with paths and status
         """
+        try:
+            mtime = os.stat(self.pki_dir).st_mtime
+        except OSError:
+            mtime = None
+
+        if (self._pki_info_cache is not None and mtime is not None
+                and mtime == self._pki_info_mtime):
+            return self._pki_info_cache
+
         pki_path = Path(self.pki_dir)
 
         # Standard easy-rsa paths
@@ -37,7 +99,7 @@ class PKIManager:
         index_file = pki_path / 'index.txt'
         serial_file = pki_path / 'serial'
 
-        return PKIInfo(
+        pki_info = PKIInfo(
             pki_dir=str(pki_path),
             ca_exists=ca_cert_path.exists(),
             ca_cert_path=str(ca_cert_path) if ca_cert_path.exists() else None,
@@ -47,9 +109,18 @@ class PKIManager:
             reqs_dir=str(reqs_dir),
             revoked_dir=str(revoked_dir),
             index_file=str(index_file),
-            serial_file=str(serial_file)
+            serial_file=str(serial_file),
+            issued_basename=issued_dir.name,
+            private_basename=private_dir.name,
+            reqs_basename=reqs_dir.name
         )
 
+        if mtime is not None:
+            self._pki_info_cache = pki_info
+            self._pki_info_mtime = mtime
+
+        return pki_info
+
     def is_initialized(self) -> bool:
         """Check if PKI is initialized.
 
@@ -70,24 +141,136 @@ class PKIManager:
     def list_certificates(self, status_filter: Optional[CertificateStatus] = None) -> List[Certificate]:
         """List all certificates.
 
+        Always returns a fresh list — never the internal cache, which
+        tail-append parsing mutates in place; callers holding the cache
+        object would see its contents change under them.
+
         Args:
             status_filter: Filter by status (None = all)
 
+        Returns:
+            List of Certificate objects
+        """
+        certificates = self._load_certificates()
+
+        if status_filter:
+            return [c for c in certificates if c.status == status_filter]
+
+        return list(certificates)
+
+    def certificates_version(self) -> int:
+        """Return a counter that changes when the certificate set does.
+
+        Call list_certificates first so the cache is current; screens
+        can then skip rebuilding menus while the counter is unchanged
+        without aliasing the mutable cache.
+
+        Returns:
+            Monotonically increasing version of the cached certificates
+        """
+        return self._cert_version
+
+    def _load_certificates(self) -> List[Certificate]:
+        """Load certificates from index.txt, using the mtime-keyed cache.
+
+        Also maintains a {common_name: Certificate} index so name lookups
+        are O(1) instead of re-parsing and scanning the file.
+
         Returns:
             List of Certificate objects
         """
         pki_info = self.get_pki_info()
 
-        if not os.path.exists(pki_info.index_file):
+        try:
+            st = os.stat(pki_info.index_file)
+        except OSError:
+            if self._cert_cache is not None:
+                self._cert_version += 1
+            self._cert_cache = None
+            self._cert_index = {}
+            self._cert_cache_size = 0
+            self._cert_cache_complete = False
             return []
 
+        if (self._cert_cache is not None and st.st_mtime == self._cert_cache_mtime
+                and st.st_size == self._cert_cache_size):
+            return self._cert_cache
+
+        # The file only grew (certs appended): parse just the new tail
+        if (self._cert_cache is not None and self._cert_cache_complete
+                and st.st_size > self._cert_cache_size
+                and self._parse_index_tail(pki_info.index_file, st)):
+            return self._cert_cache
+
+        # Full re-parse (first load, or the file was rewritten)
         certificates = EasyRSAParser.parse_index_file(pki_info.index_file)
 
-        if status_filter:
-            certificates = [c for c in certificates if c.status == status_filter]
+        # First entry wins, matching the previous linear-scan behaviour
+        index: Dict[str, Certificate] = {}
+        for cert in certificates:
+            index.setdefault(cert.common_name, cert)
+
+        self._cert_cache = certificates
+        self._cert_index = index
+        self._cert_cache_mtime = st.st_mtime
+        self._cert_cache_size = st.st_size
+        self._cert_cache_complete = self._index_ends_with_newline(
+            pki_info.index_file, st.st_size)
+        self._cert_version += 1
 
         return certificates
 
+    def _parse_index_tail(self, index_file: str, st: os.stat_result) -> bool:
+        """Parse only the bytes appended to index.txt since the last load.
+
+        Args:
+            index_file: Path to index.txt
+            st: Fresh stat result for the file
+
+        Returns:
+            True if the tail was parsed into the cache, False to force
+            a full re-parse
+        """
+        try:
+            with open(index_file, 'rb') as f:
+                f.seek(self._cert_cache_size)
+                data = f.read(st.st_size - self._cert_cache_size)
+            text = data.decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            return False
+
+        appended = False
+        for line in text.split('\n'):
+            cert = EasyRSAParser.parse_index_line(line)
+            if cert:
+                self._cert_cache.append(cert)
+                self._cert_index.setdefault(cert.common_name, cert)
+                appended = True
+
+        if appended:
+            self._cert_version += 1
+        self._cert_cache_mtime = st.st_mtime
+        self._cert_cache_size = st.st_size
+        self._cert_cache_complete = text.endswith('\n')
+        return True
+
+    @staticmethod
+    def _index_ends_with_newline(index_file: str, size: int) -> bool:
+        """Check whether index.txt ends on a line boundary.
+
+        Appends are only safe to tail-parse when the previously seen
+        data ended with a newline.
+        """
+        if size == 0:
+            return True
+
+        try:
+            with open(index_file, 'rb') as f:
+                f.seek(size - 1)
+                return f.read(1) == b'\n'
+        except OSError:
+            return False
+
     def get_certificate_by_name(self, name: str) -> Optional[Certificate]:
         """Get certificate by common name.
 
@@ -97,13 +280,8 @@ class PKIManager:
         Returns:
             Certificate object or None
         """
-        certificates = self.list_certificates()
-
-        for cert in certificates:
-            if cert.common_name == name:
-                return cert
-
-        return None
+        self._load_certificates()
+        return self._cert_index.get(name)
 
     def list_certificate_requests(self) -> List[str]:
         """List pending certificate requests.
@@ -111,17 +289,17 @@ class PKIManager:
         Returns:
             List of request filenames
         """
-        pki_info = self.get_pki_info()
-        reqs_dir = Path(pki_info.reqs_dir)
-
-        if not reqs_dir.exists():
+        try:
+            with os.scandir(self._reqs_dir) as entries:
+                req_files = [
+                    entry.name[:-4] for entry in entries
+                    if entry.name.endswith('.req') and entry.is_file(follow_symlinks=False)
+                ]
+        except OSError:
             return []
 
-        req_files = []
-        for req_file in reqs_dir.glob('*.req'):
-            req_files.append(req_file.stem)
-
-        return sorted(req_files)
+        req_files.sort()
+        return req_files
 
     def get_certificate_path(self, name: str) -> Optional[str]:
         """Get path to issued certificate file.
@@ -132,8 +310,7 @@ class PKIManager:
         Returns:
             Path to certificate file or None
         """
-        pki_info = self.get_pki_info()
-        cert_path = Path(pki_info.issued_dir) / f'{name}.crt'
+        cert_path = self._issued_dir / f'{name}.crt'
 
         if cert_path.exists():
             return str(cert_path)
@@ -149,8 +326,7 @@ class PKIManager:
         Returns:
             Path to private key file or None
         """
-        pki_info = self.get_pki_info()
-        key_path = Path(pki_info.private_dir) / f'{name}.key'
+        key_path = self._private_dir / f'{name}.key'
 
         if key_path.exists():
             return str(key_path)
@@ -166,14 +342,47 @@ class PKIManager:
         Returns:
             Path to request file or None
         """
-        pki_info = self.get_pki_info()
-        req_path = Path(pki_info.reqs_dir) / f'{name}.req'
+        req_path = self._reqs_dir / f'{name}.req'
 
         if req_path.exists():
             return str(req_path)
 
         return None
 
+    def get_certificate_details(self, name: str) -> Optional[Dict[str, object]]:
+        """Read certificate metadata by parsing the PEM in-process.
+
+        Args:
+            name: Certificate name
+
+        Returns:
+            Dict with subject/issuer/serial/not_before/not_after, or
+            None if the file is missing, unparsable, or the optional
+            cryptography package is not installed
+        """
+        if x509 is None:
+            return None
+
+        cert_path = self._issued_dir / f'{name}.crt'
+        try:
+            with open(cert_path, 'rb') as f:
+                cert = x509.load_pem_x509_certificate(f.read())
+        except (OSError, ValueError):
+            return None
+
+        # *_utc variants exist from cryptography 42 on; fall back on
+        # the naive properties for older installs
+        not_before = getattr(cert, 'not_valid_before_utc', None) or cert.not_valid_before
+        not_after = getattr(cert, 'not_valid_after_utc', None) or cert.not_valid_after
+
+        return {
+            'subject': cert.subject.rfc4514_string(),
+            'issuer': cert.issuer.rfc4514_string(),
+            'serial': format(cert.serial_number, 'X'),
+            'not_before': not_before,
+            'not_after': not_after,
+        }
+
     def get_ca_cert_path(self) -> Optional[str]:
         """Get path to CA certificate.
 
@@ -189,45 +398,41 @@ class PKIManager:
         Returns:
             Dictionary with counts by status
         """
-        certificates = self.list_certificates()
+        certificates = self._load_certificates()
+        status_counts = Counter(cert.status for cert in certificates)
 
-        counts = {
+        return {
             'total': len(certificates),
-            'valid': 0,
-            'revoked': 0,
-            'expired': 0
+            'valid': status_counts[CertificateStatus.VALID],
+            'revoked': status_counts[CertificateStatus.REVOKED],
+            'expired': status_counts[CertificateStatus.EXPIRED]
         }
 
-        for cert in certificates:
-            if cert.status == CertificateStatus.VALID:
-                counts['valid'] += 1
-            elif cert.status == CertificateStatus.REVOKED:
-                counts['revoked'] += 1
-            elif cert.status == CertificateStatus.EXPIRED:
-                counts['expired'] += 1
-
-        return counts
-
     def cleanup_revoked(self) -> int:
         """Move revoked certificates to revoked directory.
 
         Returns:
             Number of files moved
         """
-        import shutil
+        revoked_certs = self.list_certificates(CertificateStatus.REVOKED)
+        if not revoked_certs:
+            return 0
 
         pki_info = self.get_pki_info()
-        revoked_certs = self.list_certificates(CertificateStatus.REVOKED)
+        revoked_dir = Path(pki_info.revoked_dir)
+
+        try:
+            os.makedirs(revoked_dir, exist_ok=True)
+        except OSError as e:
+            print(f'Error creating revoked dir: {e}')
+            return 0
 
         count = 0
         for cert in revoked_certs:
-            cert_path = self.get_certificate_path(cert.common_name)
-            if cert_path and os.path.exists(cert_path):
-                dest_path = Path(pki_info.revoked_dir) / Path(cert_path).name
-
+            cert_path = self._issued_dir / f'{cert.common_name}.crt'
+            if cert_path.exists():
                 try:
-                    os.makedirs(pki_info.revoked_dir, exist_ok=True)
-                    shutil.move(cert_path, dest_path)
+                    shutil.move(str(cert_path), str(revoked_dir / cert_path.name))
                     count += 1
                 except Exception as e:
                     print(f'Error moving revoked cert: {e}')
@@ -2,15 +2,48 @@
 
 import subprocess
 import os
-from typing import Optional
+import re
+import shlex
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
 from pathlib import Path
 from easyrsa.models import CommandResult
 from config.settings import settings
 
+# vars file line formats, matched in one pass per line
+_SET_VAR_RE = re.compile(r'^\s*set_var\s+(\S+)\s+(.+?)\s*$')
+# The key group must exclude '=' so the split happens at the first
+# '=' on the line; values containing '=' stay intact
+_EXPORT_RE = re.compile(r'^\s*export\s+([^=\s]+)\s*=\s*(.+?)\s*$')
+
+
+def _strip_quotes(value: str) -> str:
+    """Remove one pair of surrounding quotes, if present."""
+    if len(value) >= 2 and value[0] in '"\'' and value[-1] == value[0]:
+        return value[1:-1]
+    return value
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cap captured subprocess output at limit characters.
+
+    The UI only ever shows a short excerpt of stdout/stderr, so there
+    is no reason to keep a multi-MB openssl dump alive in a
+    CommandResult.
+    """
+    if len(text) <= limit:
+        return text
+    return text[:limit] + '\n... [output truncated]'
+
 
 class EasyRSAWrapper:
     """Wrapper for easy-rsa command-line tool."""
 
+    # Maximum characters of stdout/stderr retained per command; results
+    # are display-only, and the Pi is memory-constrained
+    CAPTURE_LIMIT = 4096
+
     def __init__(self, easyrsa_bin: Optional[str] = None, pki_dir: Optional[str] = None):
         """Initialize easy-rsa wrapper.
 
@@ -23,6 +56,10 @@ class EasyRSAWrapper:
         # Set EASYRSA_PKI and EASYRSA_BATCH in process environment so they're available globally
         os.environ['EASYRSA_PKI'] = self.pki_dir
         os.environ['EASYRSA_BATCH'] = '1'
+        # Base environment for subprocesses, built once instead of per call
+        self._base_env = {**os.environ, 'EASYRSA_PKI': self.pki_dir}
+        # Long-lived shell used by interactive_session(); None = one-shot mode
+        self._session: Optional[subprocess.Popen] = None
 
     def _run_command(self, args: list, env_vars: Optional[dict] = None) -> CommandResult:
         """Run easy-rsa command.
@@ -37,12 +74,16 @@ class EasyRSAWrapper:
         # Build command
         cmd = [self.easyrsa_bin] + args
 
-        # Prepare environment
-        env = os.environ.copy()
-        env['EASYRSA_PKI'] = self.pki_dir
+        # Inside interactive_session(), reuse the long-lived shell
+        if self._session is not None and env_vars is None:
+            return self._run_in_session(cmd)
 
+        # Prepare environment (only copy the base env when there are overrides;
+        # subprocess does not mutate the mapping it is given)
         if env_vars:
-            env.update(env_vars)
+            env = {**self._base_env, **env_vars}
+        else:
+            env = self._base_env
 
         try:
             # Run command
@@ -56,8 +97,8 @@ class EasyRSAWrapper:
 
             return CommandResult(
                 success=(result.returncode == 0),
-                stdout=result.stdout,
-                stderr=result.stderr,
+                stdout=_truncate(result.stdout, self.CAPTURE_LIMIT),
+                stderr=_truncate(result.stderr, self.CAPTURE_LIMIT),
                 exit_code=result.returncode
             )
 
@@ -86,6 +127,121 @@ class EasyRSAWrapper:
                 message=f'Error running command: {e}'
             )
 
+    @contextmanager
+    def interactive_session(self):
+        """Run a batch of commands through one long-lived shell.
+
+        Process startup dominates short easy-rsa commands on the Pi.
+        Within this context, _run_command feeds each command to a single
+        persistent bash instead of forking per call, amortizing the
+        startup cost across the batch. stderr is merged into stdout for
+        session commands. Falls back to one-shot mode automatically if
+        the shell cannot be started.
+
+        Usage:
+            with easyrsa.interactive_session():
+                for name in names:
+                    easyrsa.sign_req('client', name)
+        """
+        try:
+            proc = subprocess.Popen(
+                ['bash', '-c',
+                 'while IFS= read -r cmd; do eval "$cmd" </dev/null; '
+                 'echo "__EASYRSA_DONE__$?"; done'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                env=self._base_env
+            )
+        except OSError:
+            proc = None
+
+        self._session = proc
+        try:
+            yield self
+        finally:
+            self._session = None
+            if proc is not None:
+                try:
+                    proc.stdin.close()
+                    proc.wait(timeout=10)
+                except (OSError, subprocess.TimeoutExpired):
+                    proc.kill()
+
+    def _run_in_session(self, cmd: list) -> CommandResult:
+        """Run one command through the live session shell.
+
+        Args:
+            cmd: Full command argv
+
+        Returns:
+            CommandResult object (stderr merged into stdout)
+        """
+        proc = self._session
+
+        try:
+            proc.stdin.write(shlex.join(cmd) + '\n')
+            proc.stdin.flush()
+
+            output_lines = []
+            captured = 0
+            while True:
+                line = proc.stdout.readline()
+                if not line:
+                    # Shell died mid-command
+                    return CommandResult(
+                        success=False,
+                        stdout=_truncate(''.join(output_lines), self.CAPTURE_LIMIT),
+                        stderr='Session shell terminated unexpectedly',
+                        exit_code=-1,
+                        message='Session shell terminated unexpectedly'
+                    )
+                if line.startswith('__EASYRSA_DONE__'):
+                    exit_code = int(line[len('__EASYRSA_DONE__'):])
+                    break
+                # Keep draining lines past the limit (the sentinel must
+                # still be found) but stop accumulating them
+                if captured < self.CAPTURE_LIMIT:
+                    output_lines.append(line)
+                    captured += len(line)
+
+            return CommandResult(
+                success=(exit_code == 0),
+                stdout=_truncate(''.join(output_lines), self.CAPTURE_LIMIT),
+                stderr='',
+                exit_code=exit_code
+            )
+
+        except (OSError, ValueError) as e:
+            return CommandResult(
+                success=False,
+                stdout='',
+                stderr=str(e),
+                exit_code=-1,
+                message=f'Error running command in session: {e}'
+            )
+
+    def run_many(self, arg_lists: List[list], max_workers: int = 4) -> List[CommandResult]:
+        """Run several independent easy-rsa commands concurrently.
+
+        Subprocess startup dominates bulk operations (e.g. show-cert for
+        every certificate), so independent commands are run from a thread
+        pool. Only use this for commands that touch distinct files.
+
+        Args:
+            arg_lists: List of argument lists, one per command
+            max_workers: Maximum concurrent commands
+
+        Returns:
+            List of CommandResult objects, in input order
+        """
+        if not arg_lists:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._run_command, arg_lists))
+
     def init_pki(self) -> CommandResult:
         """Initialize PKI directory structure.
 
@@ -215,6 +371,27 @@ class EasyRSAWrapper:
         args = ['gen-crl']
         return self._run_command(args)
 
+    def revoke_and_crl(self, name: str, reason: str = 'unspecified') -> Tuple[CommandResult, Optional[CommandResult]]:
+        """Revoke a certificate and regenerate the CRL in one batch.
+
+        The two commands always run together after a revocation, so they
+        share one interactive_session() shell and pay process startup
+        once instead of twice.
+
+        Args:
+            name: Certificate name to revoke
+            reason: Revocation reason
+
+        Returns:
+            Tuple of (revoke result, gen-crl result); the gen-crl result
+            is None when the revocation itself failed
+        """
+        with self.interactive_session():
+            revoke_result = self.revoke(name, reason)
+            if not revoke_result.success:
+                return revoke_result, None
+            return revoke_result, self.gen_crl()
+
     def show_cert(self, name: str) -> CommandResult:
         """Show certificate details.
 
@@ -243,22 +420,12 @@ class EasyRSAWrapper:
 
         try:
             with open(vars_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Parse set_var lines
-                    if line.startswith('set_var '):
-                        parts = line[8:].split(None, 1)
-                        if len(parts) == 2:
-                            key = parts[0]
-                            value = parts[1].strip('"\'')
-                            env_vars[key] = value
-                    # Parse export lines
-                    elif line.startswith('export '):
-                        parts = line[7:].split('=', 1)
-                        if len(parts) == 2:
-                            key = parts[0].strip()
-                            value = parts[1].strip('"\'')
-                            env_vars[key] = value
+                lines = f.read().splitlines()
+
+            for line in lines:
+                match = _SET_VAR_RE.match(line) or _EXPORT_RE.match(line)
+                if match:
+                    env_vars[match.group(1)] = _strip_quotes(match.group(2))
 
         except Exception as e:
             print(f'Error loading vars file: {e}')
@@ -16,38 +16,63 @@ class TemplateManager:
             template_dir: Template directory path (default from settings)
         """
         self.template_dir = template_dir or settings.template_dir
+        # mtime-keyed caches so hover/back navigation doesn't re-walk the
+        # directory or re-parse vars files
+        self._list_cache: Optional[List[str]] = None
+        self._list_cache_mtime: Optional[int] = None
+        self._template_cache: Dict[str, tuple] = {}
 
     def list_templates(self) -> List[str]:
         """List available templates.
 
+        The result is cached against the template directory mtime, so
+        repeated menu builds cost one stat call.
+
         Returns:
             List of template names (without .vars extension)
         """
         template_path = Path(self.template_dir)
 
-        if not template_path.exists():
+        try:
+            dir_mtime = template_path.stat().st_mtime_ns
+        except OSError:
             return []
 
+        if self._list_cache is not None and dir_mtime == self._list_cache_mtime:
+            return self._list_cache
+
         templates = []
         for vars_file in template_path.glob('*.vars'):
             templates.append(vars_file.stem)
 
-        return sorted(templates)
+        templates.sort()
+        self._list_cache = templates
+        self._list_cache_mtime = dir_mtime
+        return templates
 
     def load_template(self, template_name: str) -> Dict[str, str]:
         """Load template variables.
 
+        Parsed variables are cached against the file mtime; callers get
+        a copy so the cached dict stays pristine.
+
         Args:
             template_name: Template name (without .vars extension)
 
         Returns:
-            Dictionary of template variables
+            Dictionary of template variables, ordered by key
         """
         template_path = Path(self.template_dir) / f'{template_name}.vars'
 
-        if not template_path.exists():
+        try:
+            file_mtime = template_path.stat().st_mtime_ns
+        except OSError:
             return {}
 
+        cached = self._template_cache.get(template_name)
+        if cached is not None and cached[0] == file_mtime:
+            return dict(cached[1])
+
         variables = {}
 
         try:
@@ -77,8 +102,13 @@ class TemplateManager:
 
         except Exception as e:
             print(f'Error loading template: {e}')
+            return dict(sorted(variables.items()))
 
-        return variables
+        # Sort once at parse time; dicts preserve insertion order, so
+        # every consumer iterates in key order without re-sorting
+        variables = dict(sorted(variables.items()))
+        self._template_cache[template_name] = (file_mtime, variables)
+        return dict(variables)
 
     def save_template(self, template_name: str, variables: Dict[str, str]) -> bool:
         """Save template variables to file.
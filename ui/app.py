@@ -1,10 +1,16 @@
 """Main application window and controller."""
 
 import tkinter as tk
+import tkinter.font as tkfont
 from config.settings import settings
+from easyrsa.pki import PKIManager
+from easyrsa.wrapper import EasyRSAWrapper
+from templates.manager import TemplateManager
+from usb.manager import USBFileManager
 from ui.layout import SplitLayout, NavigationButtons
 from ui.jogdial import JogDialNavigator
 from ui.screens.base import BaseScreen
+from ui.screens.main_menu import MainMenuScreen
 
 
 class EasyRSAApp:
@@ -17,10 +23,19 @@ class EasyRSAApp:
             root: Tkinter root window
         """
         self.root = root
-        self.navigator = JogDialNavigator()
+        self.navigator = JogDialNavigator(tk_root=root)
+        # Shared per-process managers: one PKIManager means one
+        # mtime-keyed certificate cache for every screen instead of a
+        # cold cache per screen construction
+        self.pki_manager = PKIManager()
+        self.easyrsa = EasyRSAWrapper()
+        self.template_manager = TemplateManager()
+        self.usb_manager = USBFileManager()
         self.layout = None
         self.nav_buttons = None
         self.current_screen: BaseScreen = None
+        self._pending_screen: BaseScreen = None
+        self._pending_after_id = None
 
         self._setup_window()
         self._setup_layout()
@@ -30,6 +45,40 @@ class EasyRSAApp:
         """Set up main window."""
         self.root.title('Easy-RSA Manager')
 
+        # Register named fonts once; widgets reference them by name so Tk
+        # reuses one font object instead of parsing a tuple per widget
+        size_normal = settings.get('font.size_normal', 10)
+        size_small = settings.get('font.size_small', 8)
+        self.fonts = {
+            'title': tkfont.Font(
+                root=self.root,
+                name='titleFont',
+                family='DejaVu Sans',
+                size=settings.get('font.size_large', 12),
+                weight='bold'
+            ),
+            'normal': tkfont.Font(
+                root=self.root, name='normalFont',
+                family='DejaVu Sans', size=size_normal
+            ),
+            'normal_bold': tkfont.Font(
+                root=self.root, name='normalBoldFont',
+                family='DejaVu Sans', size=size_normal, weight='bold'
+            ),
+            'small': tkfont.Font(
+                root=self.root, name='smallFont',
+                family='DejaVu Sans', size=size_small
+            ),
+            'small_bold': tkfont.Font(
+                root=self.root, name='smallBoldFont',
+                family='DejaVu Sans', size=size_small, weight='bold'
+            ),
+            'mono': tkfont.Font(
+                root=self.root, name='monoFont',
+                family='DejaVu Sans Mono', size=size_small
+            ),
+        }
+
         # Set window size
         window_width = settings.window_width
         window_height = settings.window_height
@@ -46,14 +95,27 @@ class EasyRSAApp:
         # Black background
         self.root.configure(bg='black')
 
-        # Bind escape key to exit fullscreen (for testing)
-        self.root.bind('<Escape>', lambda e: self.root.attributes('-fullscreen', False))
-
-        # Bind keyboard shortcuts for development/testing
-        self.root.bind('<Up>', lambda e: self._on_up())
-        self.root.bind('<Down>', lambda e: self._on_down())
-        self.root.bind('<Return>', lambda e: self._on_confirm())
-        self.root.bind('<BackSpace>', lambda e: self._go_back())
+        # One <Key> binding dispatching through a dict keyed by keysym
+        # (includes development/testing shortcuts); Escape exits
+        # fullscreen for testing
+        self._key_dispatch = {
+            'Up': self._on_up,
+            'Down': self._on_down,
+            'Return': self._on_confirm,
+            'BackSpace': self._go_back,
+            'Escape': self._exit_fullscreen,
+        }
+        self.root.bind('<Key>', self._dispatch_key)
+
+    def _dispatch_key(self, event):
+        """Route a key event to its handler, if any."""
+        handler = self._key_dispatch.get(event.keysym)
+        if handler:
+            handler()
+
+    def _exit_fullscreen(self):
+        """Leave fullscreen mode."""
+        self.root.attributes('-fullscreen', False)
 
     def _setup_layout(self):
         """Set up split layout."""
@@ -62,8 +124,8 @@ class EasyRSAApp:
     def _setup_navigation(self):
         """Set up navigation buttons."""
         button_frame = self.layout.get_button_frame()
-        self.nav_buttons = NavigationButtons(button_frame)
-        self.nav_buttons.bind_commands(
+        self.nav_buttons = NavigationButtons(
+            button_frame,
             up_cmd=self._on_up,
             down_cmd=self._on_down,
             confirm_cmd=self._on_confirm
@@ -92,19 +154,50 @@ class EasyRSAApp:
     def show_screen(self, screen: BaseScreen):
         """Show a screen.
 
+        Transitions are coalesced on the next idle tick: a confirm chain
+        that requests several screens back-to-back (go_back followed by a
+        new confirm) lays out only the final one. Each screen keeps a
+        persistent frame that is built once and then re-packed on
+        revisit, so navigation is a couple of Tcl calls instead of a full
+        destroy+rebuild of the widget tree.
+
         Args:
             screen: Screen to display
         """
+        self._pending_screen = screen
+        if self._pending_after_id is None:
+            self._pending_after_id = self.root.after_idle(self._apply_pending_screen)
+
+    def _apply_pending_screen(self):
+        """Apply the most recently requested screen transition."""
+        self._pending_after_id = None
+        screen = self._pending_screen
+        self._pending_screen = None
+        if screen is None:
+            return
+
+        old_screen = self.current_screen
+
         # Exit current screen
-        if self.current_screen:
-            self.current_screen.exit()
+        if old_screen:
+            old_screen.exit()
+
+        # Hide (don't destroy) the current screen frame
+        self.layout.hide_current()
 
-        # Clear content area
-        self.layout.clear_content()
+        # Bind navigation to the new screen before building so set_items
+        # calls during build/refresh notify the right screen
+        self.navigator.bind_screen(screen)
 
-        # Build new screen
-        content_frame = self.layout.get_content_frame()
-        screen.build(content_frame)
+        if screen.frame is None:
+            frame = tk.Frame(self.layout.get_content_frame(), bg='white')
+            screen.frame = frame
+            screen.build(frame)
+        else:
+            # Reused frame: let the screen update its dynamic content
+            screen.refresh()
+
+        screen.frame.pack(fill=tk.BOTH, expand=True)
 
         # Enter new screen
         screen.enter()
@@ -112,10 +205,16 @@ class EasyRSAApp:
         # Update current screen
         self.current_screen = screen
 
+        # Free the frame of a screen that is no longer reachable via the
+        # navigation stack, so abandoned screens don't accumulate widgets
+        if (old_screen and old_screen is not screen
+                and old_screen.frame is not None
+                and old_screen not in self.navigator.screen_stack):
+            old_screen.destroy_frame()
+
     def run(self):
         """Start the application main loop."""
         # Show main menu
-        from ui.screens.main_menu import MainMenuScreen
         self.show_screen(MainMenuScreen(self, self.navigator))
 
         # Start Tkinter main loop
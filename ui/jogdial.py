@@ -1,55 +1,130 @@
 """Jog-dial navigation system for menu and list navigation."""
 
-from typing import Callable, List, Optional, Any
+import weakref
+from typing import List, Optional, Any
 
 
 class JogDialNavigator:
     """Navigation manager for jog-dial interface (up/down/confirm)."""
 
-    def __init__(self):
-        """Initialize jog-dial navigator."""
+    def __init__(self, tk_root=None):
+        """Initialize jog-dial navigator.
+
+        Args:
+            tk_root: Tk root used to coalesce bursts of move events via
+                after_idle. Without it, moves apply synchronously.
+        """
         self.items: List[Any] = []
+        self._n = 0
         self.current_index: int = 0
-        self.on_selection_changed: Optional[Callable[[int, Any], None]] = None
-        self.on_confirm: Optional[Callable[[int, Any], None]] = None
+        # Weak references to the bound screen and its callbacks; the
+        # navigator must not keep an abandoned screen (and its widget
+        # tree) alive once it has left the navigation stack
+        self._screen: Optional[weakref.ref] = None
+        self._on_selection_changed: Optional[weakref.WeakMethod] = None
+        self._on_confirm: Optional[weakref.WeakMethod] = None
         self.screen_stack: List[Any] = []
+        self.tk_root = tk_root
+        self._pending_delta = 0
+        self._flush_scheduled = False
+
+    def bind_screen(self, screen: Any):
+        """Point the navigation callbacks at a screen.
+
+        No-op when the screen is already bound, so repeated enter() calls
+        on a cached screen cost one identity check instead of two
+        weak-method allocations. Callbacks are held as WeakMethods so a
+        popped screen can be collected even while still bound here.
+
+        Args:
+            screen: Screen providing on_selection_changed/on_confirm
+        """
+        if self._screen is not None and self._screen() is screen:
+            return
+        self._screen = weakref.ref(screen)
+        self._on_selection_changed = weakref.WeakMethod(screen.on_selection_changed)
+        self._on_confirm = weakref.WeakMethod(screen.on_confirm)
 
     def set_items(self, items: List[Any]):
         """Set the list of items to navigate.
 
         Args:
-            items: List of items to navigate through
+            items: Sequence of items to navigate through; snapshotted
+                as a tuple so later caller-side mutation can't desync
+                the cached length
         """
+        items = tuple(items)
         self.items = items
+        self._n = len(items)
         self.current_index = 0 if items else -1
-        if self.on_selection_changed and items:
-            self.on_selection_changed(self.current_index, items[self.current_index])
+        if items:
+            self._notify_selection()
 
     def move_up(self):
         """Move selection up (previous item)."""
-        if not self.items:
-            return
-
-        self.current_index = (self.current_index - 1) % len(self.items)
-        if self.on_selection_changed:
-            self.on_selection_changed(self.current_index, self.items[self.current_index])
+        self._queue_move(-1)
 
     def move_down(self):
         """Move selection down (next item)."""
+        self._queue_move(1)
+
+    def _queue_move(self, delta: int):
+        """Apply or defer a selection move.
+
+        Fast key repeats and jog-dial spins fire events faster than Tk
+        can repaint, so moves are accumulated into one net delta that is
+        applied on the next idle tick, producing a single redraw.
+
+        Args:
+            delta: +1 for down, -1 for up
+        """
         if not self.items:
             return
 
-        self.current_index = (self.current_index + 1) % len(self.items)
-        if self.on_selection_changed:
-            self.on_selection_changed(self.current_index, self.items[self.current_index])
+        if self.tk_root is None:
+            self._apply_delta(delta)
+            self._notify_selection()
+            return
+
+        self._pending_delta += delta
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.tk_root.after_idle(self._flush_moves)
+
+    def _flush_moves(self):
+        """Apply the accumulated move delta in one step."""
+        self._flush_scheduled = False
+        delta = self._pending_delta
+        self._pending_delta = 0
+
+        if not delta or not self.items:
+            return
+
+        self._apply_delta(delta)
+        self._notify_selection()
+
+    def _apply_delta(self, delta: int):
+        """Update the current index by delta (with wraparound).
+
+        Args:
+            delta: Net movement to apply
+        """
+        self.current_index = (self.current_index + delta) % self._n
+
+    def _notify_selection(self):
+        """Invoke the selection-changed callback for the current item."""
+        callback = self._on_selection_changed() if self._on_selection_changed else None
+        if callback:
+            callback(self.current_index, self.items[self.current_index])
 
     def confirm(self):
         """Confirm current selection."""
         if not self.items or self.current_index < 0:
             return
 
-        if self.on_confirm:
-            self.on_confirm(self.current_index, self.items[self.current_index])
+        callback = self._on_confirm() if self._on_confirm else None
+        if callback:
+            callback(self.current_index, self.items[self.current_index])
 
     def get_current_item(self) -> Optional[Any]:
         """Get currently selected item.
@@ -105,54 +180,45 @@ class JogDialNavigator:
 class ScrollableNavigator(JogDialNavigator):
     """Extended navigator with scrolling support for long lists."""
 
-    def __init__(self, visible_items: int = 5):
+    def __init__(self, visible_items: int = 5, tk_root=None):
         """Initialize scrollable navigator.
 
         Args:
             visible_items: Number of items visible at once
+            tk_root: Tk root for move coalescing (see JogDialNavigator)
         """
-        super().__init__()
+        super().__init__(tk_root=tk_root)
         self.visible_items = visible_items
         self.scroll_offset = 0
+        self._max_offset = 0
 
     def set_items(self, items: List[Any]):
         """Set items and reset scroll.
 
+        The list length and maximum scroll offset are cached here so the
+        per-keypress path never recomputes them.
+
         Args:
             items: List of items to navigate
         """
         super().set_items(items)
         self.scroll_offset = 0
+        self._max_offset = max(0, self._n - self.visible_items)
 
-    def move_up(self):
-        """Move up with scrolling."""
-        if not self.items:
-            return
-
-        old_index = self.current_index
-        super().move_up()
-
-        # Adjust scroll if needed
-        if self.current_index < self.scroll_offset:
-            self.scroll_offset = self.current_index
-        elif old_index == 0 and self.current_index == len(self.items) - 1:
-            # Wrapped to end
-            self.scroll_offset = max(0, len(self.items) - self.visible_items)
-
-    def move_down(self):
-        """Move down with scrolling."""
-        if not self.items:
-            return
+    def _apply_delta(self, delta: int):
+        """Update index and keep the selection inside the visible window.
 
-        old_index = self.current_index
-        super().move_down()
+        Args:
+            delta: Net movement to apply
+        """
+        index = (self.current_index + delta) % self._n
+        self.current_index = index
 
-        # Adjust scroll if needed
-        if self.current_index >= self.scroll_offset + self.visible_items:
-            self.scroll_offset = self.current_index - self.visible_items + 1
-        elif old_index == len(self.items) - 1 and self.current_index == 0:
-            # Wrapped to start
-            self.scroll_offset = 0
+        # Adjust scroll if needed (covers wraparound in both directions)
+        if index < self.scroll_offset:
+            self.scroll_offset = index
+        elif index >= self.scroll_offset + self.visible_items:
+            self.scroll_offset = min(index - self.visible_items + 1, self._max_offset)
 
     def get_visible_items(self) -> List[Any]:
         """Get currently visible items.
@@ -164,7 +230,7 @@ class ScrollableNavigator(JogDialNavigator):
             return []
 
         start = self.scroll_offset
-        end = min(start + self.visible_items, len(self.items))
+        end = min(start + self.visible_items, self._n)
         return self.items[start:end]
 
     def get_visible_range(self) -> tuple:
@@ -177,7 +243,7 @@ class ScrollableNavigator(JogDialNavigator):
             return (0, 0)
 
         start = self.scroll_offset
-        end = min(start + self.visible_items, len(self.items))
+        end = min(start + self.visible_items, self._n)
         return (start, end)
 
     def is_scrollable(self) -> bool:
@@ -186,4 +252,4 @@ class ScrollableNavigator(JogDialNavigator):
         Returns:
             True if more items than visible
         """
-        return len(self.items) > self.visible_items
+        return self._n > self.visible_items
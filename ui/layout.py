@@ -1,6 +1,7 @@
 """Layout manager for split content/button interface."""
 
 import tkinter as tk
+from tkinter import ttk
 from config.settings import settings
 
 
@@ -20,6 +21,8 @@ class SplitLayout:
 
     def _setup_layout(self):
         """Set up the split layout with content and button areas."""
+        window_height = settings.window_height
+
         # Main container
         container = tk.Frame(self.parent, bg='black')
         container.pack(fill=tk.BOTH, expand=True)
@@ -28,7 +31,7 @@ class SplitLayout:
         self.content_frame = tk.Frame(
             container,
             width=settings.content_width,
-            height=settings.window_height,
+            height=window_height,
             bg='white'
         )
         self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -38,7 +41,7 @@ class SplitLayout:
         self.button_frame = tk.Frame(
             container,
             width=settings.button_width,
-            height=settings.window_height,
+            height=window_height,
             bg='#2c3e50'
         )
         self.button_frame.pack(side=tk.RIGHT, fill=tk.Y)
@@ -60,94 +63,113 @@ class SplitLayout:
         """
         return self.button_frame
 
-    def clear_content(self):
-        """Clear all widgets from content area."""
+    def hide_current(self):
+        """Hide the currently mapped screen frame without destroying it.
+
+        Widget creation/destruction dominates Tk navigation cost, so
+        screen frames are unmapped and kept for reuse instead.
+        """
         for widget in self.content_frame.winfo_children():
-            widget.destroy()
+            if widget.winfo_ismapped():
+                widget.pack_forget()
 
 
 class NavigationButtons:
     """Navigation button manager for jog-dial interface."""
 
-    def __init__(self, parent: tk.Frame):
+    def __init__(self, parent: tk.Frame, up_cmd=None, down_cmd=None, confirm_cmd=None):
         """Initialize navigation buttons.
 
+        Commands are bound at construction so the buttons never go
+        through a second config(command=...) round-trip.
+
         Args:
             parent: Parent frame for buttons (typically button_frame from SplitLayout)
+            up_cmd: Command for up button
+            down_cmd: Command for down button
+            confirm_cmd: Command for confirm button
         """
         self.parent = parent
         self.up_button = None
         self.down_button = None
         self.confirm_button = None
-        self._setup_buttons()
-
-    def _setup_buttons(self):
-        """Create and layout navigation buttons."""
-        button_config = {
-            'width': 8,
-            'height': 2,
-            'bg': '#3498db',
-            'fg': 'white',
-            'font': ('DejaVu Sans', settings.get('font.size_large', 12), 'bold'),
-            'relief': tk.RAISED,
-            'bd': 3,
-            'activebackground': '#2980b9',
-            'activeforeground': 'white'
-        }
+        self._buttons = ()
+        self._setup_buttons(up_cmd, down_cmd, confirm_cmd)
+
+    def _setup_buttons(self, up_cmd, down_cmd, confirm_cmd):
+        """Create and layout navigation buttons.
+
+        Uses ttk buttons with styles registered once; press/hover state
+        changes are handled by the style engine instead of the full
+        widget relayout classic tk.Button does on X11.
+        """
+        spacing = settings.button_spacing
+
+        style = ttk.Style(self.parent)
+        style.configure(
+            'Nav.TButton',
+            font='titleFont',
+            background='#3498db',
+            foreground='white',
+            width=8,
+            padding=(10, 12)
+        )
+        style.map(
+            'Nav.TButton',
+            background=[('active', '#2980b9'), ('disabled', '#7f8c8d')]
+        )
+        style.configure(
+            'NavConfirm.TButton',
+            font='titleFont',
+            background='#27ae60',
+            foreground='white',
+            width=8,
+            padding=(10, 18)
+        )
+        style.map(
+            'NavConfirm.TButton',
+            background=[('active', '#229954'), ('disabled', '#7f8c8d')]
+        )
 
         # Add vertical spacing
         top_spacer = tk.Frame(self.parent, bg='#2c3e50', height=40)
         top_spacer.pack(side=tk.TOP)
 
         # Up button
-        self.up_button = tk.Button(
+        self.up_button = ttk.Button(
             self.parent,
             text='▲ UP',
-            **button_config
+            style='Nav.TButton',
+            command=up_cmd
         )
-        self.up_button.pack(side=tk.TOP, pady=settings.button_spacing, padx=10)
+        self.up_button.pack(side=tk.TOP, pady=spacing, padx=10)
 
         # Down button
-        self.down_button = tk.Button(
+        self.down_button = ttk.Button(
             self.parent,
             text='▼ DOWN',
-            **button_config
+            style='Nav.TButton',
+            command=down_cmd
         )
-        self.down_button.pack(side=tk.TOP, pady=settings.button_spacing, padx=10)
+        self.down_button.pack(side=tk.TOP, pady=spacing, padx=10)
 
         # Confirm button (slightly different styling)
-        confirm_config = button_config.copy()
-        confirm_config['bg'] = '#27ae60'
-        confirm_config['activebackground'] = '#229954'
-        confirm_config['height'] = 3
-
-        self.confirm_button = tk.Button(
+        self.confirm_button = ttk.Button(
             self.parent,
             text='✓ OK',
-            **confirm_config
+            style='NavConfirm.TButton',
+            command=confirm_cmd
         )
-        self.confirm_button.pack(side=tk.TOP, pady=settings.button_spacing * 2, padx=10)
-
-    def bind_commands(self, up_cmd, down_cmd, confirm_cmd):
-        """Bind commands to navigation buttons.
+        self.confirm_button.pack(side=tk.TOP, pady=spacing * 2, padx=10)
 
-        Args:
-            up_cmd: Command for up button
-            down_cmd: Command for down button
-            confirm_cmd: Command for confirm button
-        """
-        self.up_button.config(command=up_cmd)
-        self.down_button.config(command=down_cmd)
-        self.confirm_button.config(command=confirm_cmd)
+        self._buttons = (self.up_button, self.down_button, self.confirm_button)
 
     def enable(self):
         """Enable all navigation buttons."""
-        self.up_button.config(state=tk.NORMAL)
-        self.down_button.config(state=tk.NORMAL)
-        self.confirm_button.config(state=tk.NORMAL)
+        for button in self._buttons:
+            button.state(['!disabled'])
 
     def disable(self):
         """Disable all navigation buttons."""
-        self.up_button.config(state=tk.DISABLED)
-        self.down_button.config(state=tk.DISABLED)
-        self.confirm_button.config(state=tk.DISABLED)
+        for button in self._buttons:
+            button.state(['disabled'])
@@ -1,15 +1,53 @@
 """Base screen class for all application screens."""
 
+import threading
 import tkinter as tk
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import Optional, Callable
 from ui.jogdial import JogDialNavigator
-from config.settings import settings
+from ui.widgets import MenuList, ProgressIndicator
+
+# Named fonts registered once by EasyRSAApp; passing names lets Tk reuse
+# a single font object instead of resolving a tuple per widget
+_NORMAL_FONT = 'normalFont'
+_SMALL_FONT_BOLD = 'smallBoldFont'
+
+
+def _build_title_bar(parent: tk.Frame, title: str, bg: str = '#2c3e50') -> tk.Frame:
+    """Create the standard 40px title bar with a left-aligned label.
+
+    Args:
+        parent: Frame to pack the title bar into
+        title: Title text
+        bg: Bar background color
+
+    Returns:
+        The title bar frame
+    """
+    title_bar = tk.Frame(parent, bg=bg, height=40)
+    title_bar.pack(fill=tk.X)
+    title_bar.pack_propagate(False)
+    tk.Label(
+        title_bar,
+        text=title,
+        bg=bg,
+        fg='white',
+        font='titleFont',
+        anchor='w',
+        padx=10
+    ).pack(fill=tk.BOTH, expand=True)
+    return title_bar
 
 
 class BaseScreen(ABC):
     """Abstract base class for all screens."""
 
+    # __weakref__ keeps slotted screens weak-referenceable; the
+    # navigator holds its bound screen through weakrefs only
+    __slots__ = ('app', 'navigator', 'content_frame', 'is_active', 'frame',
+                 '__weakref__')
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize base screen.
 
@@ -21,6 +59,9 @@ class BaseScreen(ABC):
         self.navigator = navigator
         self.content_frame: Optional[tk.Frame] = None
         self.is_active = False
+        # Persistent frame managed by EasyRSAApp.show_screen; built once,
+        # then re-packed on revisit
+        self.frame: Optional[tk.Frame] = None
 
     @abstractmethod
     def build(self, content_frame: tk.Frame):
@@ -34,22 +75,49 @@ class BaseScreen(ABC):
     def enter(self):
         """Called when screen becomes active."""
         self.is_active = True
-        self._setup_navigation()
+        self.navigator.bind_screen(self)
 
     def exit(self):
         """Called when screen becomes inactive."""
         self.is_active = False
-        self.navigator.on_selection_changed = None
-        self.navigator.on_confirm = None
 
     def refresh(self):
-        """Refresh screen content."""
+        """Refresh screen content when the built frame is reused."""
         pass
 
-    def _setup_navigation(self):
-        """Set up navigation callbacks for this screen."""
-        self.navigator.on_selection_changed = self.on_selection_changed
-        self.navigator.on_confirm = self.on_confirm
+    def run_async(self, work: Callable, on_done: Optional[Callable] = None):
+        """Run blocking work off the UI thread.
+
+        work() executes on a daemon thread; on_done(result) is marshalled
+        back onto the Tk event loop via after(), so handlers can touch
+        widgets safely.
+
+        Args:
+            work: Callable executed on the background thread
+            on_done: Callback receiving work's return value on the UI thread
+        """
+        def runner():
+            result = work()
+            if on_done:
+                self.app.root.after(0, lambda: on_done(result))
+
+        threading.Thread(target=runner, daemon=True).start()
+
+    @contextmanager
+    def batch_updates(self):
+        """Defer menu-list redraws until the outermost block exits.
+
+        Reentrant; screens without a menu list get a no-op block.
+        """
+        widget = getattr(self, 'menu_list_widget', None)
+        if widget is None:
+            yield
+            return
+        widget.begin_batch()
+        try:
+            yield
+        finally:
+            widget.end_batch()
 
     def on_selection_changed(self, index: int, item):
         """Handle selection change.
@@ -88,7 +156,8 @@ class BaseScreen(ABC):
             title: Screen title
             message: Message text
         """
-        self.navigator.push_screen(self)
+        if self.navigator.get_current_screen() is not self:
+            self.navigator.push_screen(self)
         self.app.show_screen(InfoScreen(self.app, self.navigator, title, message))
 
     def show_confirm(self, title: str, message: str, on_yes=None, on_no=None):
@@ -100,9 +169,29 @@ class BaseScreen(ABC):
             on_yes: Callable invoked when user selects Yes
             on_no: Callable invoked when user selects No
         """
-        self.navigator.push_screen(self)
+        if self.navigator.get_current_screen() is not self:
+            self.navigator.push_screen(self)
         self.app.show_screen(ConfirmScreen(self.app, self.navigator, title, message, on_yes, on_no))
 
+    def destroy_frame(self):
+        """Destroy the persistent frame and drop widget references.
+
+        Called when a screen falls off the navigation stack; clearing
+        the widget attributes breaks the Python-side reference cycles
+        that keep destroyed Tk widgets alive.
+        """
+        if self.frame is not None:
+            self.frame.destroy()
+            self.frame = None
+        self.content_frame = None
+        if hasattr(self, 'menu_list_widget'):
+            self.menu_list_widget = None
+        if hasattr(self, '_text_widget'):
+            self._text_widget = None
+        if hasattr(self, '_progress'):
+            self._progress = None
+            self._progress_hidden = None
+
     def go_back(self):
         """Navigate back to previous screen."""
         previous_screen = self.navigator.pop_screen()
@@ -113,6 +202,9 @@ class BaseScreen(ABC):
 class MenuScreen(BaseScreen):
     """Base class for menu-based screens."""
 
+    __slots__ = ('title', 'menu_items', 'menu_list_widget', '_last_selection_index',
+                 '_progress', '_progress_hidden')
+
     def __init__(self, app, navigator: JogDialNavigator, title: str = ''):
         """Initialize menu screen.
 
@@ -125,6 +217,9 @@ class MenuScreen(BaseScreen):
         self.title = title
         self.menu_items = []
         self.menu_list_widget = None
+        self._last_selection_index = -1
+        self._progress = None
+        self._progress_hidden = None
 
     def build(self, content_frame: tk.Frame):
         """Build menu screen UI.
@@ -136,67 +231,164 @@ class MenuScreen(BaseScreen):
 
         # Title bar
         if self.title:
-            title_bar = tk.Frame(content_frame, bg='#2c3e50', height=40)
-            title_bar.pack(fill=tk.X)
-            title_bar.pack_propagate(False)
-
-            title_label = tk.Label(
-                title_bar,
-                text=self.title,
-                bg='#2c3e50',
-                fg='white',
-                font=('DejaVu Sans', settings.get('font.size_large', 12), 'bold'),
-                anchor='w',
-                padx=10
-            )
-            title_label.pack(fill=tk.BOTH, expand=True)
+            _build_title_bar(content_frame, self.title)
 
         # Menu list
-        from ui.widgets import MenuList
         self.menu_list_widget = MenuList(content_frame, visible_items=6)
         self.menu_list_widget.pack(fill=tk.BOTH, expand=True)
 
         # Set menu items
-        self._build_menu_items()
-        menu_labels = [item['label'] for item in self.menu_items]
-        self.menu_list_widget.set_items(menu_labels)
-        self.navigator.set_items(self.menu_items)
+        self._refresh_menu()
 
     @abstractmethod
     def _build_menu_items(self):
         """Build menu items list. Override in subclass."""
         pass
 
+    def _refresh_menu(self):
+        """Rebuild menu items into the existing list widget."""
+        self._last_selection_index = -1
+        self._build_menu_items()
+        # Freeze the rebuilt list; the navigator and widget keep
+        # references, so an immutable snapshot can't drift under them
+        self.menu_items = tuple(self.menu_items)
+        menu_labels = tuple(item['label'] for item in self.menu_items)
+        with self.batch_updates():
+            self.menu_list_widget.set_items(menu_labels)
+            self.navigator.set_items(self.menu_items)
+
+    def refresh(self):
+        """Refresh menu content when the built frame is reused.
+
+        While an operation is in flight the refresh is a no-op: confirm
+        flows call go_back() (which only schedules the transition back
+        to this screen) and then _show_progress, so the deferred
+        transition's refresh would otherwise tear the progress display
+        down again the moment it was shown. The completion handler
+        hides the progress explicitly.
+        """
+        if self._progress_hidden is not None:
+            return
+        self._refresh_menu()
+
+    def _show_progress(self, message: str):
+        """Show a progress indicator in place of the menu.
+
+        The menu widgets are hidden with pack_forget rather than
+        destroyed, and one ProgressIndicator per screen is created
+        lazily and reused, so showing progress costs a couple of
+        geometry calls instead of a widget teardown plus a full
+        rebuild on the next visit.
+
+        While the progress is showing, jog-dial and back input on this
+        screen is ignored so a second PKI mutation can't be started
+        mid-operation; the async completion handler must call
+        _hide_progress (or navigate via show_message after doing so).
+
+        Args:
+            message: Progress message
+        """
+        if self._progress_hidden is None:
+            self._progress_hidden = [
+                (widget, widget.pack_info())
+                for widget in self.content_frame.winfo_children()
+                if widget.winfo_manager() == 'pack'
+            ]
+            for widget, _ in self._progress_hidden:
+                widget.pack_forget()
+
+        if self._progress is None:
+            self._progress = ProgressIndicator(self.content_frame)
+        self._progress.pack(fill=tk.BOTH, expand=True)
+        self._progress.set_message(message)
+        self._progress.set_progress(50)
+
+        # Flush pending draw/geometry work without re-entering the
+        # event loop (update() reprocesses input events recursively)
+        self.content_frame.update_idletasks()
+
+    def _hide_progress(self):
+        """Restore the menu widgets hidden by _show_progress."""
+        if self._progress_hidden is None:
+            return
+        self._progress.pack_forget()
+        for widget, pack_info in self._progress_hidden:
+            widget.pack(**pack_info)
+        self._progress_hidden = None
+
+    def on_up(self):
+        """Handle up button press (ignored while an operation runs)."""
+        if self._progress_hidden is not None:
+            return
+        super().on_up()
+
+    def on_down(self):
+        """Handle down button press (ignored while an operation runs)."""
+        if self._progress_hidden is not None:
+            return
+        super().on_down()
+
+    def on_confirm_button(self):
+        """Handle confirm button press (ignored while an operation runs)."""
+        if self._progress_hidden is not None:
+            return
+        super().on_confirm_button()
+
+    def go_back(self):
+        """Navigate back (ignored while an operation runs)."""
+        if self._progress_hidden is not None:
+            return
+        super().go_back()
+
     def enter(self):
         """Called when screen becomes active."""
         super().enter()
         if self.menu_list_widget:
-            self.menu_list_widget.set_selection(self.navigator.get_current_index())
+            index = self.navigator.get_current_index()
+            if index != self._last_selection_index:
+                self._last_selection_index = index
+                self.menu_list_widget.set_selection(index)
 
     def on_selection_changed(self, index: int, item):
         """Handle selection change.
 
+        A no-op when the index hasn't moved, so repeated events (e.g.
+        boundary wraps) don't trigger a Tk redraw.
+
         Args:
             index: New selection index
             item: Selected item
         """
+        if index == self._last_selection_index:
+            return
+        self._last_selection_index = index
         if self.menu_list_widget:
             self.menu_list_widget.set_selection(index)
 
     def on_confirm(self, index: int, item):
         """Handle confirm action.
 
+        Items built from a homogeneous list may carry an 'arg' entry;
+        the action is then a shared bound method called with that
+        argument, so list screens don't allocate a closure per row.
+
         Args:
             index: Confirmed item index
             item: Confirmed item (menu item dict)
         """
-        if 'action' in item and item['action']:
-            item['action']()
+        action = item.get('action')
+        if action:
+            if 'arg' in item:
+                action(item['arg'])
+            else:
+                action()
 
 
 class FormScreen(BaseScreen):
     """Base class for form-based screens."""
 
+    __slots__ = ('title', 'form_fields')
+
     def __init__(self, app, navigator: JogDialNavigator, title: str = ''):
         """Initialize form screen.
 
@@ -219,20 +411,7 @@ class FormScreen(BaseScreen):
 
         # Title bar
         if self.title:
-            title_bar = tk.Frame(content_frame, bg='#2c3e50', height=40)
-            title_bar.pack(fill=tk.X)
-            title_bar.pack_propagate(False)
-
-            title_label = tk.Label(
-                title_bar,
-                text=self.title,
-                bg='#2c3e50',
-                fg='white',
-                font=('DejaVu Sans', settings.get('font.size_large', 12), 'bold'),
-                anchor='w',
-                padx=10
-            )
-            title_label.pack(fill=tk.BOTH, expand=True)
+            _build_title_bar(content_frame, self.title)
 
         # Form area
         form_area = tk.Frame(content_frame, bg='white')
@@ -253,6 +432,8 @@ class FormScreen(BaseScreen):
 class InfoScreen(BaseScreen):
     """Displays a title and scrollable message. OK goes back."""
 
+    __slots__ = ('title', 'message', '_text_widget')
+
     def __init__(self, app, navigator: JogDialNavigator, title: str, message: str):
         super().__init__(app, navigator)
         self.title = title
@@ -263,15 +444,7 @@ class InfoScreen(BaseScreen):
         self.content_frame = content_frame
 
         if self.title:
-            title_bar = tk.Frame(content_frame, bg='#2c3e50', height=40)
-            title_bar.pack(fill=tk.X)
-            title_bar.pack_propagate(False)
-            tk.Label(
-                title_bar, text=self.title,
-                bg='#2c3e50', fg='white',
-                font=('DejaVu Sans', settings.get('font.size_large', 12), 'bold'),
-                anchor='w', padx=10
-            ).pack(fill=tk.BOTH, expand=True)
+            _build_title_bar(content_frame, self.title)
 
         hint_bar = tk.Frame(content_frame, bg='#27ae60', height=28)
         hint_bar.pack(fill=tk.X, side=tk.BOTTOM)
@@ -279,7 +452,7 @@ class InfoScreen(BaseScreen):
         tk.Label(
             hint_bar, text='OK \u2192 Back',
             bg='#27ae60', fg='white',
-            font=('DejaVu Sans', settings.get('font.size_small', 8), 'bold'),
+            font=_SMALL_FONT_BOLD,
             anchor='center'
         ).pack(fill=tk.BOTH, expand=True)
 
@@ -287,14 +460,34 @@ class InfoScreen(BaseScreen):
             content_frame,
             wrap=tk.WORD,
             bg='white', fg='#2c3e50',
-            font=('DejaVu Sans', settings.get('font.size_normal', 10)),
+            font=_NORMAL_FONT,
             padx=10, pady=8,
             relief=tk.FLAT, highlightthickness=0
         )
-        self._text_widget.insert(1.0, self.message)
         self._text_widget.config(state=tk.DISABLED)
         self._text_widget.pack(fill=tk.BOTH, expand=True)
 
+        if len(self.message) <= 4096:
+            self._append_text(self.message)
+        else:
+            # Large status dumps stream in chunk-by-chunk so the first
+            # frame paints immediately instead of blocking on one insert
+            self._stream_message()
+
+    def _append_text(self, chunk: str):
+        self._text_widget.config(state=tk.NORMAL)
+        self._text_widget.insert(tk.END, chunk)
+        self._text_widget.config(state=tk.DISABLED)
+
+    def _stream_message(self, start: int = 0, step: int = 4096):
+        if self._text_widget is None or not self._text_widget.winfo_exists():
+            return
+        chunk = self.message[start:start + step]
+        if not chunk:
+            return
+        self._append_text(chunk)
+        self._text_widget.after_idle(self._stream_message, start + step, step)
+
     def on_up(self):
         if self._text_widget:
             self._text_widget.yview_scroll(-1, 'units')
@@ -310,6 +503,8 @@ class InfoScreen(BaseScreen):
 class ConfirmScreen(MenuScreen):
     """Displays a message with Yes/No menu. Callbacks are invoked after selection."""
 
+    __slots__ = ('message', 'on_yes_callback', 'on_no_callback')
+
     def __init__(self, app, navigator: JogDialNavigator, title: str, message: str,
                  on_yes=None, on_no=None):
         super().__init__(app, navigator, title=title)
@@ -321,34 +516,22 @@ class ConfirmScreen(MenuScreen):
         self.content_frame = content_frame
 
         if self.title:
-            title_bar = tk.Frame(content_frame, bg='#e67e22', height=40)
-            title_bar.pack(fill=tk.X)
-            title_bar.pack_propagate(False)
-            tk.Label(
-                title_bar, text=self.title,
-                bg='#e67e22', fg='white',
-                font=('DejaVu Sans', settings.get('font.size_large', 12), 'bold'),
-                anchor='w', padx=10
-            ).pack(fill=tk.BOTH, expand=True)
+            _build_title_bar(content_frame, self.title, bg='#e67e22')
 
         msg_frame = tk.Frame(content_frame, bg='#fef9e7')
         msg_frame.pack(fill=tk.BOTH, expand=True)
         tk.Label(
             msg_frame, text=self.message,
             bg='#fef9e7', fg='#2c3e50',
-            font=('DejaVu Sans', settings.get('font.size_normal', 10)),
+            font=_NORMAL_FONT,
             anchor='nw', padx=10, pady=8,
             justify=tk.LEFT, wraplength=340
         ).pack(fill=tk.BOTH, expand=True)
 
-        from ui.widgets import MenuList
         self.menu_list_widget = MenuList(content_frame, visible_items=2)
         self.menu_list_widget.pack(fill=tk.X)
 
-        self._build_menu_items()
-        menu_labels = [item['label'] for item in self.menu_items]
-        self.menu_list_widget.set_items(menu_labels)
-        self.navigator.set_items(self.menu_items)
+        self._refresh_menu()
 
     def _build_menu_items(self):
         self.menu_items = [
@@ -1,18 +1,16 @@
 """CA initialization screen."""
 
-import tkinter as tk
 from ui.screens.base import MenuScreen
 from ui.jogdial import JogDialNavigator
-from ui.widgets import InfoPanel, ProgressIndicator
-from easyrsa.wrapper import EasyRSAWrapper
-from easyrsa.pki import PKIManager
-from templates.manager import TemplateManager
+from ui.widgets import InfoPanel
 from config.settings import settings
 
 
 class CAInitScreen(MenuScreen):
     """CA initialization wizard screen."""
 
+    __slots__ = ('easyrsa', 'pki_manager', 'template_manager', 'selected_template')
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize CA init screen.
 
@@ -21,9 +19,9 @@ class CAInitScreen(MenuScreen):
             navigator: Jog-dial navigator instance
         """
         super().__init__(app, navigator, title='Initialize CA')
-        self.easyrsa = EasyRSAWrapper()
-        self.pki_manager = PKIManager()
-        self.template_manager = TemplateManager()
+        self.easyrsa = app.easyrsa
+        self.pki_manager = app.pki_manager
+        self.template_manager = app.template_manager
         self.selected_template = None
 
     def _build_menu_items(self):
@@ -95,8 +93,14 @@ Certificates:
         )
 
     def _do_init_pki(self):
+        # Run the easyrsa subprocess off-thread; the progress frame
+        # stays responsive instead of freezing the jog-dial
         self._show_progress('Initializing PKI...')
-        result = self.easyrsa.init_pki()
+        self.run_async(self.easyrsa.init_pki, self._on_init_done)
+
+    def _on_init_done(self, result):
+        self._hide_progress()
+        self.pki_manager.invalidate()
         if result.success:
             self.show_message('Success', 'PKI initialized successfully!\n\nYou can now build the CA.')
         else:
@@ -119,7 +123,11 @@ Certificates:
 
     def _do_reinit_pki(self):
         self._show_progress('Reinitializing PKI...')
-        result = self.easyrsa.init_pki()
+        self.run_async(self.easyrsa.init_pki, self._on_reinit_done)
+
+    def _on_reinit_done(self, result):
+        self._hide_progress()
+        self.pki_manager.invalidate()
         if result.success:
             self.show_message('Success', 'PKI reinitialized.\n\nYou can now build a new CA.')
         else:
@@ -164,8 +172,21 @@ Certificates:
         """
         self._show_progress(f'Building CA: {ca_cn}...')
 
-        # Build CA
-        result = self.easyrsa.build_ca(common_name=ca_cn, nopass=True)
+        # Key generation can take a while on a Pi; build off-thread
+        self.run_async(
+            lambda: self.easyrsa.build_ca(common_name=ca_cn, nopass=True),
+            lambda result: self._on_ca_built(result, ca_cn)
+        )
+
+    def _on_ca_built(self, result, ca_cn: str):
+        """Report the CA build result.
+
+        Args:
+            result: CommandResult from the background build
+            ca_cn: CA common name
+        """
+        self._hide_progress()
+        self.pki_manager.invalidate()
 
         if result.success:
             self.show_message('Success',
@@ -174,29 +195,12 @@ Certificates:
             error_msg = result.stderr or result.stdout or 'Unknown error'
             self.show_message('Error', f'Failed to build CA:\n\n{error_msg[:200]}')
 
-    def _show_progress(self, message: str):
-        """Show progress indicator.
-
-        Args:
-            message: Progress message
-        """
-        # Clear content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Show progress
-        progress = ProgressIndicator(self.content_frame)
-        progress.pack(fill=tk.BOTH, expand=True)
-        progress.set_message(message)
-        progress.set_progress(50)
-
-        # Update display
-        self.content_frame.update()
-
 
 class TemplateSelectScreen(MenuScreen):
     """Template selection screen."""
 
+    __slots__ = ('template_type', 'on_select_callback', 'template_manager', '_needle')
+
     def __init__(self, app, navigator: JogDialNavigator, template_type: str = 'ca', on_select=None):
         """Initialize template select screen.
 
@@ -208,7 +212,9 @@ class TemplateSelectScreen(MenuScreen):
         """
         self.template_type = template_type
         self.on_select_callback = on_select
-        self.template_manager = TemplateManager()
+        self.template_manager = app.template_manager
+        # Fold the filter once instead of per template per rebuild
+        self._needle = template_type.casefold() if template_type else None
         super().__init__(app, navigator, title=f'Select {template_type.upper()} Template')
 
     def _build_menu_items(self):
@@ -216,8 +222,8 @@ class TemplateSelectScreen(MenuScreen):
         templates = self.template_manager.list_templates()
 
         # Filter by type if specified
-        if self.template_type:
-            templates = [t for t in templates if self.template_type.lower() in t.lower()]
+        if self._needle is not None:
+            templates = [t for t in templates if self._needle in t.casefold()]
 
         self.menu_items = [
             {
@@ -1,17 +1,21 @@
 """Certificate creation screen."""
 
-import tkinter as tk
 from ui.screens.base import MenuScreen
+from ui.screens.cert_name_input import CertNameInputScreen
 from ui.jogdial import JogDialNavigator
-from ui.widgets import ProgressIndicator
-from easyrsa.wrapper import EasyRSAWrapper
-from easyrsa.pki import PKIManager
-from templates.manager import TemplateManager
 
 
 class CertCreateScreen(MenuScreen):
     """Certificate creation screen."""
 
+    __slots__ = (
+        'easyrsa',
+        'pki_manager',
+        'template_manager',
+        'current_cert_type',
+        'current_template',
+    )
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize certificate creation screen.
 
@@ -20,9 +24,9 @@ class CertCreateScreen(MenuScreen):
             navigator: Jog-dial navigator instance
         """
         super().__init__(app, navigator, title='Create Certificate')
-        self.easyrsa = EasyRSAWrapper()
-        self.pki_manager = PKIManager()
-        self.template_manager = TemplateManager()
+        self.easyrsa = app.easyrsa
+        self.pki_manager = app.pki_manager
+        self.template_manager = app.template_manager
 
     def _build_menu_items(self):
         """Build certificate creation menu items."""
@@ -79,7 +83,6 @@ class CertCreateScreen(MenuScreen):
 
         # Show CN input screen
         self.navigator.push_screen(self)
-        from ui.screens.cert_name_input import CertNameInputScreen
         input_screen = CertNameInputScreen(
             self.app,
             self.navigator,
@@ -120,11 +123,28 @@ class CertCreateScreen(MenuScreen):
         """
         self._show_progress(f'Creating {cert_type} certificate:\n{cert_name}')
 
-        # Build certificate based on type
+        # Build certificate based on type; key generation runs
+        # off-thread so the progress frame stays responsive
         if cert_type == 'server':
-            result = self.easyrsa.build_server_full(cert_name, nopass=True)
+            build = self.easyrsa.build_server_full
         else:  # client
-            result = self.easyrsa.build_client_full(cert_name, nopass=True)
+            build = self.easyrsa.build_client_full
+
+        self.run_async(
+            lambda: build(cert_name, nopass=True),
+            lambda result: self._on_certificate_built(result, cert_type, cert_name)
+        )
+
+    def _on_certificate_built(self, result, cert_type: str, cert_name: str):
+        """Report the certificate build result.
+
+        Args:
+            result: CommandResult from the background build
+            cert_type: Certificate type
+            cert_name: Certificate name
+        """
+        self._hide_progress()
+        self.pki_manager.invalidate()
 
         if result.success:
             cert_path = self.pki_manager.get_certificate_path(cert_name)
@@ -140,22 +160,3 @@ class CertCreateScreen(MenuScreen):
         else:
             error_msg = result.stderr or result.stdout or 'Unknown error'
             self.show_message('Error', f'Failed to create certificate:\n\n{error_msg[:200]}')
-
-    def _show_progress(self, message: str):
-        """Show progress indicator.
-
-        Args:
-            message: Progress message
-        """
-        # Clear content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Show progress
-        progress = ProgressIndicator(self.content_frame)
-        progress.pack(fill=tk.BOTH, expand=True)
-        progress.set_message(message)
-        progress.set_progress(50)
-
-        # Update display
-        self.content_frame.update()
@@ -2,14 +2,14 @@
 
 from ui.screens.base import MenuScreen
 from ui.jogdial import JogDialNavigator
-from easyrsa.pki import PKIManager
-from usb.manager import USBFileManager
 from easyrsa.models import CertificateStatus
 
 
 class CertExportScreen(MenuScreen):
     """Certificate export screen."""
 
+    __slots__ = ('usb_path', 'pki_manager', 'usb_manager', '_certificates')
+
     def __init__(self, app, navigator: JogDialNavigator, usb_path: str):
         """Initialize certificate export screen.
 
@@ -20,13 +20,33 @@ class CertExportScreen(MenuScreen):
         """
         super().__init__(app, navigator, title='Export Certificates')
         self.usb_path = usb_path
-        self.pki_manager = PKIManager()
-        self.usb_manager = USBFileManager()
+        self.pki_manager = app.pki_manager
+        self.usb_manager = app.usb_manager
+        self._certificates = None
 
     def _build_menu_items(self):
-        """Build certificate export menu items."""
+        """Build certificate export menu items.
+
+        The first build kicks the index scan onto a background thread so
+        entering the screen never stalls the jog-dial; later builds hit
+        the PKIManager mtime cache and run inline. Certificate entries
+        carry their Certificate object and are dispatched from
+        on_confirm, instead of allocating a closure per certificate on
+        every build.
+        """
+        if self._certificates is None:
+            self.menu_items = [
+                {'label': '← Back', 'action': self.go_back},
+                {'label': '(Loading certificates...)', 'action': None}
+            ]
+            self.run_async(
+                lambda: self.pki_manager.list_certificates(CertificateStatus.VALID),
+                self._on_certificates_loaded
+            )
+            return
+
         # List valid certificates only
-        certificates = self.pki_manager.list_certificates(CertificateStatus.VALID)
+        self._certificates = self.pki_manager.list_certificates(CertificateStatus.VALID)
 
         self.menu_items = [
             {
@@ -35,10 +55,10 @@ class CertExportScreen(MenuScreen):
             }
         ]
 
-        if not certificates:
+        if not self._certificates:
             self.menu_items.append({
                 'label': '(No certificates to export)',
-                'action': lambda: None
+                'action': None
             })
         else:
             # Add CA certificate option
@@ -48,12 +68,35 @@ class CertExportScreen(MenuScreen):
             })
 
             # Add individual certificates
-            for cert in certificates:
+            for cert in self._certificates:
                 self.menu_items.append({
                     'label': f'📄 {cert.common_name}',
-                    'action': lambda c=cert: self._export_certificate(c)
+                    'cert': cert
                 })
 
+    def _on_certificates_loaded(self, certificates):
+        """Swap the loaded certificate list into the menu.
+
+        Args:
+            certificates: Valid certificates from the background scan
+        """
+        self._certificates = certificates
+        if self.is_active:
+            self._refresh_menu()
+
+    def on_confirm(self, index: int, item):
+        """Handle confirm action.
+
+        Args:
+            index: Confirmed item index
+            item: Confirmed item (menu item dict)
+        """
+        cert = item.get('cert')
+        if cert is not None:
+            self._export_certificate(cert)
+        else:
+            super().on_confirm(index, item)
+
     def _export_ca(self):
         """Export CA certificate."""
         ca_path = self.pki_manager.get_ca_cert_path()
@@ -62,8 +105,14 @@ class CertExportScreen(MenuScreen):
             self.show_message('Error', 'CA certificate not found')
             return
 
-        if self.usb_manager.export_certificate(ca_path, self.usb_path):
-            self.show_message('Success', f'CA certificate exported to USB')
+        self.run_async(
+            lambda: self.usb_manager.export_certificate(ca_path, self.usb_path),
+            self._on_ca_exported
+        )
+
+    def _on_ca_exported(self, success: bool):
+        if success:
+            self.show_message('Success', 'CA certificate exported to USB')
         else:
             self.show_message('Error', 'Failed to export CA certificate')
 
@@ -89,15 +138,28 @@ class CertExportScreen(MenuScreen):
         )
 
     def _do_export_bundle(self, cert, cert_path, key_path, ca_path):
-        if self.usb_manager.export_certificate_bundle(
-            cert_path, key_path, ca_path, self.usb_path, cert.common_name
-        ):
-            self.show_message('Success', f'Certificate bundle exported:\n\n{cert.common_name}/')
-        else:
-            self.show_message('Error', 'Failed to export certificate bundle')
+        # Copy to USB off-thread; slow drives must not freeze the jog-dial
+        self.run_async(
+            lambda: self.usb_manager.export_certificate_bundle(
+                cert_path, key_path, ca_path, self.usb_path, cert.common_name
+            ),
+            lambda success: self._on_cert_exported(
+                success, f'Certificate bundle exported:\n\n{cert.common_name}/',
+                'Failed to export certificate bundle'
+            )
+        )
 
     def _do_export_cert_only(self, cert, cert_path):
-        if self.usb_manager.export_certificate(cert_path, self.usb_path):
-            self.show_message('Success', f'Certificate exported:\n\n{cert.common_name}.crt')
+        self.run_async(
+            lambda: self.usb_manager.export_certificate(cert_path, self.usb_path),
+            lambda success: self._on_cert_exported(
+                success, f'Certificate exported:\n\n{cert.common_name}.crt',
+                'Failed to export certificate'
+            )
+        )
+
+    def _on_cert_exported(self, success: bool, success_msg: str, error_msg: str):
+        if success:
+            self.show_message('Success', success_msg)
         else:
-            self.show_message('Error', 'Failed to export certificate')
+            self.show_message('Error', error_msg)
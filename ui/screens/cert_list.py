@@ -2,15 +2,14 @@
 
 from ui.screens.base import MenuScreen
 from ui.jogdial import JogDialNavigator
-from easyrsa.pki import PKIManager
-from easyrsa.wrapper import EasyRSAWrapper
 from easyrsa.models import CertificateStatus
-import os
 
 
 class CertListScreen(MenuScreen):
     """Certificate list screen."""
 
+    __slots__ = ('pki_manager', 'easyrsa', 'certificates', '_certs_version')
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize certificate list screen.
 
@@ -19,13 +18,29 @@ class CertListScreen(MenuScreen):
             navigator: Jog-dial navigator instance
         """
         super().__init__(app, navigator, title='Certificate List')
-        self.pki_manager = PKIManager()
-        self.easyrsa = EasyRSAWrapper()
-        self.certificates = []
+        # Shared managers: the app-wide PKIManager keeps its certificate
+        # cache warm across screen instances
+        self.pki_manager = app.pki_manager
+        self.easyrsa = app.easyrsa
+        self.certificates = None
+        self._certs_version = -1
 
     def _build_menu_items(self):
-        """Build certificate list menu items."""
-        self.certificates = self.pki_manager.list_certificates()
+        """Build certificate list menu items.
+
+        PKIManager bumps a version counter whenever its certificate
+        cache changes (including in-place tail appends), so entry dicts
+        are rebuilt only when the set actually changed; repeat visits
+        reuse the frozen menu as-is. The visible rendering is already
+        windowed by MenuList, so this keeps large PKIs O(visible rows)
+        per visit rather than O(certs).
+        """
+        certificates = self.pki_manager.list_certificates()
+        version = self.pki_manager.certificates_version()
+        if version == self._certs_version and self.menu_items:
+            return
+        self._certs_version = version
+        self.certificates = certificates
 
         self.menu_items = [
             {
@@ -41,11 +56,8 @@ class CertListScreen(MenuScreen):
             })
         else:
             for cert in self.certificates:
-                status_icon = '✓' if cert.status == CertificateStatus.VALID else '✗'
-                label = f'{status_icon} {cert.common_name}'
-
                 self.menu_items.append({
-                    'label': label,
+                    'label': cert.display_label,
                     'action': lambda c=cert: self._show_cert_details(c)
                 })
 
@@ -64,6 +76,8 @@ class CertListScreen(MenuScreen):
 class CertDetailScreen(MenuScreen):
     """Certificate detail screen."""
 
+    __slots__ = ('certificate', 'pki_manager', 'easyrsa')
+
     def __init__(self, app, navigator: JogDialNavigator, certificate, pki_manager):
         """Initialize certificate detail screen.
 
@@ -75,7 +89,7 @@ class CertDetailScreen(MenuScreen):
         """
         self.certificate = certificate
         self.pki_manager = pki_manager
-        self.easyrsa = EasyRSAWrapper()
+        self.easyrsa = app.easyrsa
         super().__init__(app, navigator, title=f'Cert: {certificate.common_name}')
 
     def _build_menu_items(self):
@@ -117,7 +131,19 @@ Status: {cert.status.name}
 
 Expiration: {cert.expiration_date.strftime('%Y-%m-%d %H:%M')}
 Days Left: {cert.days_until_expiration()}
+"""
+
+        # Fields read straight from the PEM when cryptography is
+        # available — no openssl/easyrsa subprocess on this path
+        parsed = self.pki_manager.get_certificate_details(cert.common_name)
+        if parsed:
+            details += f"""
+Subject: {parsed['subject']}
+Issuer: {parsed['issuer']}
+Valid From: {parsed['not_before'].strftime('%Y-%m-%d %H:%M')}
+"""
 
+        details += f"""
 Certificate File:
 {cert_path if cert_path else 'Not found'}
 
@@ -141,9 +167,30 @@ Key File:
         )
 
     def _do_revoke_cert(self):
-        result = self.easyrsa.revoke(self.certificate.common_name)
+        """Run revoke + gen-crl on a worker thread."""
+        self._show_progress(f'Revoking {self.certificate.common_name}...')
+        name = self.certificate.common_name
+
+        self.run_async(
+            lambda: self.easyrsa.revoke_and_crl(name),
+            self._on_cert_revoked
+        )
+
+    def _on_cert_revoked(self, results):
+        """Report the revocation result.
+
+        Args:
+            results: (revoke, gen-crl) CommandResult pair from the
+                background batch; the second entry is None when the
+                revocation failed
+        """
+        self._hide_progress()
+        result, crl_result = results
+
         if result.success:
-            crl_result = self.easyrsa.gen_crl()
+            # Drop the cached certificate list; the revocation rewrote
+            # index.txt and a same-second mtime could mask it
+            self.pki_manager.invalidate()
             if crl_result.success:
                 self.show_message('Success', 'Certificate revoked successfully.\n\nCRL updated.')
             else:
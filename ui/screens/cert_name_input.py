@@ -9,6 +9,30 @@ from config.settings import settings
 class CertNameInputScreen(BaseScreen):
     """Certificate name input screen with character-by-character selection."""
 
+    # Character set for input (alphanumeric + hyphen + underscore) plus
+    # control entries; immutable and shared across screen instances
+    _CHARSET = tuple('abcdefghijklmnopqrstuvwxyz0123456789-_.') + (
+        '[SPACE]', '[DONE]', '[DELETE]', '[CANCEL]')
+
+    # Pre-resolved display strings for the control entries; everything
+    # else displays as itself, so per-keypress rendering is one dict get
+    _DISPLAY = {
+        '[SPACE]': '␣',
+        '[DONE]': 'DONE',
+        '[DELETE]': 'DELETE',
+        '[CANCEL]': 'CANCEL',
+    }
+
+    __slots__ = (
+        'cert_type',
+        'on_submit_callback',
+        'current_name',
+        'char_index',
+        'name_frame',
+        'name_display',
+        'char_display',
+    )
+
     def __init__(self, app, navigator: JogDialNavigator, cert_type: str = '', on_submit=None):
         """Initialize cert name input screen.
 
@@ -24,13 +48,6 @@ class CertNameInputScreen(BaseScreen):
         self.current_name = []
         self.char_index = 0
 
-        # Character set for input (alphanumeric + hyphen + underscore)
-        self.charset = list('abcdefghijklmnopqrstuvwxyz0123456789-_.')
-        self.charset.append('[SPACE]')
-        self.charset.append('[DONE]')
-        self.charset.append('[DELETE]')
-        self.charset.append('[CANCEL]')
-
     def build(self, content_frame: tk.Frame):
         """Build the input screen UI.
 
@@ -49,7 +66,7 @@ class CertNameInputScreen(BaseScreen):
             text=f'Enter {self.cert_type} Certificate Name',
             bg='#2c3e50',
             fg='white',
-            font=('DejaVu Sans', settings.get('font.size_normal', 10), 'bold'),
+            font='normalBoldFont',
             anchor='w',
             padx=10
         )
@@ -65,7 +82,7 @@ class CertNameInputScreen(BaseScreen):
             text='Current name:',
             bg='white',
             fg='#7f8c8d',
-            font=('DejaVu Sans', settings.get('font.size_small', 8)),
+            font='smallFont',
             anchor='w',
             padx=10
         )
@@ -91,7 +108,7 @@ class CertNameInputScreen(BaseScreen):
             text='Select character (↑↓ to change, OK to add):',
             bg='#ecf0f1',
             fg='#2c3e50',
-            font=('DejaVu Sans', settings.get('font.size_small', 8)),
+            font='smallFont',
             anchor='center',
             pady=5
         )
@@ -99,7 +116,7 @@ class CertNameInputScreen(BaseScreen):
 
         self.char_display = tk.Label(
             char_frame,
-            text=self.charset[0],
+            text=self._CHARSET[0],
             bg='#3498db',
             fg='white',
             font=('DejaVu Sans Mono', 32, 'bold'),
@@ -114,14 +131,20 @@ class CertNameInputScreen(BaseScreen):
             text='Use ↑↓ to select character, OK to add\nSelect [DONE] when finished',
             bg='white',
             fg='#95a5a6',
-            font=('DejaVu Sans', settings.get('font.size_small', 8)),
+            font='smallFont',
             justify=tk.CENTER,
             pady=5
         )
         info_label.pack()
 
         # Set up navigator with characters
-        self.navigator.set_items(self.charset)
+        self.navigator.set_items(self._CHARSET)
+        self._update_display()
+
+    def refresh(self):
+        """Re-arm the navigator with the character set on frame reuse."""
+        self.char_index = 0
+        self.navigator.set_items(self._CHARSET)
         self._update_display()
 
     def on_selection_changed(self, index: int, item):
@@ -137,27 +160,33 @@ class CertNameInputScreen(BaseScreen):
     def on_confirm(self, index: int, item):
         """Handle character confirmation.
 
+        Control entries dispatch through _CONTROL_ACTIONS; anything
+        else is a plain character appended to the name.
+
         Args:
             index: Confirmed item index
             item: Selected character
         """
-        char = self.charset[index]
-
-        if char == '[DONE]':
-            self._submit_name()
-        elif char == '[DELETE]':
-            if self.current_name:
-                self.current_name.pop()
-                self._update_display()
-        elif char == '[CANCEL]':
-            self.go_back()
-        elif char == '[SPACE]':
-            self.current_name.append(' ')
-            self._update_display()
+        char = self._CHARSET[index]
+
+        handler = self._CONTROL_ACTIONS.get(char)
+        if handler:
+            handler(self)
         else:
             self.current_name.append(char)
             self._update_display()
 
+    def _delete_char(self):
+        """Remove the last entered character, if any."""
+        if self.current_name:
+            self.current_name.pop()
+            self._update_display()
+
+    def _add_space(self):
+        """Append a space to the name."""
+        self.current_name.append(' ')
+        self._update_display()
+
     def _update_display(self):
         """Update the display."""
         # Update name display
@@ -167,22 +196,15 @@ class CertNameInputScreen(BaseScreen):
         self.name_display.config(text=current_text)
 
         # Update character display
-        char = self.charset[self.char_index]
-        display_char = char
-        if char == '[SPACE]':
-            display_char = '␣'
-        elif char.startswith('['):
-            display_char = char[1:-1]
-
-        self.char_display.config(text=display_char)
+        char = self._CHARSET[self.char_index]
+        self.char_display.config(text=self._DISPLAY.get(char, char))
 
     def _submit_name(self):
         """Submit the entered name."""
         name = ''.join(self.current_name).strip()
 
         if not name:
-            from ui.widgets import MessageBox
-            MessageBox(self.content_frame, 'Error', 'Name cannot be empty', ['OK']).get_result()
+            self.show_message('Error', 'Name cannot be empty')
             return
 
         # Go back to previous screen
@@ -191,3 +213,12 @@ class CertNameInputScreen(BaseScreen):
         # Call callback
         if self.on_submit_callback:
             self.on_submit_callback(name)
+
+    # Control-entry dispatch table (plain functions, called with self);
+    # one dict lookup per confirm instead of a string-compare chain
+    _CONTROL_ACTIONS = {
+        '[DONE]': _submit_name,
+        '[DELETE]': _delete_char,
+        '[CANCEL]': BaseScreen.go_back,
+        '[SPACE]': _add_space,
+    }
@@ -1,16 +1,14 @@
 """Certificate request signing screen."""
 
-import tkinter as tk
 from ui.screens.base import MenuScreen
 from ui.jogdial import JogDialNavigator
-from ui.widgets import ProgressIndicator
-from easyrsa.pki import PKIManager
-from easyrsa.wrapper import EasyRSAWrapper
 
 
 class CertSignScreen(MenuScreen):
     """Certificate signing request screen."""
 
+    __slots__ = ('pki_manager', 'easyrsa', 'pending_requests')
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize certificate signing screen.
 
@@ -19,8 +17,8 @@ class CertSignScreen(MenuScreen):
             navigator: Jog-dial navigator instance
         """
         super().__init__(app, navigator, title='Sign Certificate Request')
-        self.pki_manager = PKIManager()
-        self.easyrsa = EasyRSAWrapper()
+        self.pki_manager = app.pki_manager
+        self.easyrsa = app.easyrsa
         self.pending_requests = []
 
     def _build_menu_items(self):
@@ -84,8 +82,21 @@ class CertSignScreen(MenuScreen):
         """
         self._show_progress(f'Signing certificate:\n{req_name}')
 
-        result = self.easyrsa.sign_req(cert_type, req_name)
+        # Sign off-thread; the easyrsa subprocess must not block the UI
+        self.run_async(
+            lambda: self.easyrsa.sign_req(cert_type, req_name),
+            lambda result: self._on_request_signed(result, req_name, cert_type)
+        )
+
+    def _on_request_signed(self, result, req_name: str, cert_type: str):
+        """Report the signing result.
 
+        Args:
+            result: CommandResult from the background signing
+            req_name: Request name
+            cert_type: Certificate type
+        """
+        self._hide_progress()
         if result.success:
             cert_path = self.pki_manager.get_certificate_path(req_name)
             msg = f'Certificate signed successfully!\n\n'
@@ -97,29 +108,12 @@ class CertSignScreen(MenuScreen):
             error_msg = result.stderr or result.stdout or 'Unknown error'
             self.show_message('Error', f'Failed to sign certificate:\n\n{error_msg[:200]}')
 
-    def _show_progress(self, message: str):
-        """Show progress indicator.
-
-        Args:
-            message: Progress message
-        """
-        # Clear content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Show progress
-        progress = ProgressIndicator(self.content_frame)
-        progress.pack(fill=tk.BOTH, expand=True)
-        progress.set_message(message)
-        progress.set_progress(50)
-
-        # Update display
-        self.content_frame.update()
-
 
 class CertTypeSelectScreen(MenuScreen):
     """Certificate type selection screen."""
 
+    __slots__ = ('req_name', 'on_select_callback')
+
     def __init__(self, app, navigator: JogDialNavigator, req_name: str, on_select=None):
         """Initialize certificate type selection screen.
 
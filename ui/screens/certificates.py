@@ -1,13 +1,17 @@
 """Certificates menu screen."""
 
 from ui.screens.base import MenuScreen
+from ui.screens.cert_create import CertCreateScreen
+from ui.screens.cert_list import CertListScreen
+from ui.screens.cert_sign import CertSignScreen
 from ui.jogdial import JogDialNavigator
-from easyrsa.pki import PKIManager
 
 
 class CertificatesMenuScreen(MenuScreen):
     """Certificates menu screen."""
 
+    __slots__ = ('pki_manager',)
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize certificates menu screen.
 
@@ -16,7 +20,9 @@ class CertificatesMenuScreen(MenuScreen):
             navigator: Jog-dial navigator instance
         """
         super().__init__(app, navigator, title='Certificates')
-        self.pki_manager = PKIManager()
+        # The menu only needs has_ca(); the app-wide manager answers
+        # that from its cached PKIInfo without a fresh stat storm
+        self.pki_manager = app.pki_manager
 
     def _build_menu_items(self):
         """Build certificates menu items."""
@@ -54,17 +60,14 @@ class CertificatesMenuScreen(MenuScreen):
     def _create_cert(self):
         """Navigate to certificate creation."""
         self.navigator.push_screen(self)
-        from ui.screens.cert_create import CertCreateScreen
         self.app.show_screen(CertCreateScreen(self.app, self.navigator))
 
     def _list_certs(self):
         """Navigate to certificate list."""
         self.navigator.push_screen(self)
-        from ui.screens.cert_list import CertListScreen
         self.app.show_screen(CertListScreen(self.app, self.navigator))
 
     def _sign_cert(self):
         """Navigate to certificate signing."""
         self.navigator.push_screen(self)
-        from ui.screens.cert_sign import CertSignScreen
         self.app.show_screen(CertSignScreen(self.app, self.navigator))
@@ -1,12 +1,25 @@
 """Main menu screen."""
 
+import os
+import platform
+
 from ui.screens.base import MenuScreen
+from ui.screens.certificates import CertificatesMenuScreen
+from ui.screens.settings import SettingsMenuScreen
+from ui.screens.usb_import import USBImportExportScreen
 from ui.jogdial import JogDialNavigator
 
+# Immutable for the process lifetime; platform.release() may shell out
+# to uname, so resolve these once at import instead of per menu entry
+_PLATFORM_INFO = (platform.system(), platform.release(),
+                  platform.machine(), platform.python_version())
+
 
 class MainMenuScreen(MenuScreen):
     """Main menu screen with primary navigation options."""
 
+    __slots__ = ()
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize main menu screen.
 
@@ -43,34 +56,27 @@ class MainMenuScreen(MenuScreen):
 
     def _goto_settings(self):
         """Navigate to settings menu."""
-        # Push current screen to stack
         self.navigator.push_screen(self)
-        # Import here to avoid circular dependency
-        from ui.screens.settings import SettingsMenuScreen
         self.app.show_screen(SettingsMenuScreen(self.app, self.navigator))
 
     def _goto_certificates(self):
         """Navigate to certificates menu."""
         self.navigator.push_screen(self)
-        from ui.screens.certificates import CertificatesMenuScreen
         self.app.show_screen(CertificatesMenuScreen(self.app, self.navigator))
 
     def _goto_usb(self):
         """Navigate to USB import/export."""
         self.navigator.push_screen(self)
-        from ui.screens.usb_import import USBImportExportScreen
         self.app.show_screen(USBImportExportScreen(self.app, self.navigator))
 
     def _show_system_info(self):
         """Show system information."""
-        import platform
-        import os
-
+        system, release, machine, python_version = _PLATFORM_INFO
         info = f"""System Information
 
-Platform: {platform.system()} {platform.release()}
-Machine: {platform.machine()}
-Python: {platform.python_version()}
+Platform: {system} {release}
+Machine: {machine}
+Python: {python_version}
 
 Working Directory:
 {os.getcwd()}
@@ -1,16 +1,23 @@
 """Settings menu screen."""
 
 from ui.screens.base import MenuScreen
+from ui.screens.ca_init import CAInitScreen
+from ui.screens.template_mgmt import TemplateManagementScreen
 from ui.jogdial import JogDialNavigator
-from easyrsa.pki import PKIManager
 from config.settings import settings
 import platform
 import os
 
+# Resolved once at import; these never change within the process
+_PLATFORM_INFO = (platform.system(), platform.release(),
+                  platform.machine(), platform.python_version())
+
 
 class SettingsMenuScreen(MenuScreen):
     """Settings menu screen."""
 
+    __slots__ = ('pki_manager',)
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize settings menu screen.
 
@@ -19,7 +26,7 @@ class SettingsMenuScreen(MenuScreen):
             navigator: Jog-dial navigator instance
         """
         super().__init__(app, navigator, title='Settings')
-        self.pki_manager = PKIManager()
+        self.pki_manager = app.pki_manager
 
     def _build_menu_items(self):
         """Build settings menu items."""
@@ -49,12 +56,13 @@ class SettingsMenuScreen(MenuScreen):
     def _goto_ca_init(self):
         """Navigate to CA initialization screen."""
         self.navigator.push_screen(self)
-        from ui.screens.ca_init import CAInitScreen
         self.app.show_screen(CAInitScreen(self.app, self.navigator))
 
     def _show_pki_settings(self):
         """Show PKI settings."""
         pki_info = self.pki_manager.get_pki_info()
+        initialized = pki_info.is_initialized()
+        has_ca = pki_info.has_ca()
 
         info = f"""PKI Configuration
 
@@ -62,15 +70,15 @@ PKI Directory:
 {pki_info.pki_dir}
 
 Status:
-{'✓ Initialized' if pki_info.is_initialized() else '✗ Not initialized'}
+{'✓ Initialized' if initialized else '✗ Not initialized'}
 
 CA Status:
-{'✓ CA exists' if pki_info.has_ca() else '✗ No CA'}
+{'✓ CA exists' if has_ca else '✗ No CA'}
 
 Paths:
-- Issued: {os.path.basename(pki_info.issued_dir)}
-- Private: {os.path.basename(pki_info.private_dir)}
-- Requests: {os.path.basename(pki_info.reqs_dir)}
+- Issued: {pki_info.issued_basename}
+- Private: {pki_info.private_basename}
+- Requests: {pki_info.reqs_basename}
 
 Easy-RSA Binary:
 {settings.easyrsa_bin}
@@ -80,7 +88,6 @@ Easy-RSA Binary:
     def _goto_templates(self):
         """Navigate to template management."""
         self.navigator.push_screen(self)
-        from ui.screens.template_mgmt import TemplateManagementScreen
         self.app.show_screen(TemplateManagementScreen(self.app, self.navigator))
 
     def _show_system_info(self):
@@ -88,20 +95,23 @@ Easy-RSA Binary:
         pki_info = self.pki_manager.get_pki_info()
         cert_counts = self.pki_manager.count_certificates()
 
+        initialized = pki_info.is_initialized()
+        has_ca = pki_info.has_ca()
+        system, release, machine, python_version = _PLATFORM_INFO
         info = f"""System Information
 
-Platform: {platform.system()}
-Release: {platform.release()}
-Machine: {platform.machine()}
-Python: {platform.python_version()}
+Platform: {system}
+Release: {release}
+Machine: {machine}
+Python: {python_version}
 
 Application:
 Version: 1.0
 Display: {settings.window_width}x{settings.window_height}
 
 PKI Status:
-- Initialized: {'Yes' if pki_info.is_initialized() else 'No'}
-- CA Present: {'Yes' if pki_info.has_ca() else 'No'}
+- Initialized: {'Yes' if initialized else 'No'}
+- CA Present: {'Yes' if has_ca else 'No'}
 - Total Certs: {cert_counts['total']}
 - Valid Certs: {cert_counts['valid']}
 
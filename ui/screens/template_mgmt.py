@@ -2,12 +2,13 @@
 
 from ui.screens.base import MenuScreen
 from ui.jogdial import JogDialNavigator
-from templates.manager import TemplateManager
 
 
 class TemplateManagementScreen(MenuScreen):
     """Template management screen."""
 
+    __slots__ = ('template_manager',)
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize template management screen.
 
@@ -16,7 +17,7 @@ class TemplateManagementScreen(MenuScreen):
             navigator: Jog-dial navigator instance
         """
         super().__init__(app, navigator, title='Template Management')
-        self.template_manager = TemplateManager()
+        self.template_manager = app.template_manager
 
     def _build_menu_items(self):
         """Build template management menu items."""
@@ -50,11 +51,11 @@ class TemplateManagementScreen(MenuScreen):
         """
         variables = self.template_manager.load_template(template_name)
 
-        details = f"""Template: {template_name}
-
-Variables:
-"""
-        for key, value in sorted(variables.items()):
-            details += f"\n{key}:\n  {value}\n"
+        # Collect parts and join once; += in the loop would copy the
+        # growing string per variable. load_template already returns the
+        # variables in key order, so no sort is needed here.
+        parts = [f'Template: {template_name}\n\nVariables:\n']
+        for key, value in variables.items():
+            parts.append(f'\n{key}:\n  {value}\n')
 
-        self.show_message(f'Template: {template_name}', details)
+        self.show_message(f'Template: {template_name}', ''.join(parts))
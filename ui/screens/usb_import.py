@@ -1,18 +1,41 @@
 """USB import/export screen."""
 
 from ui.screens.base import MenuScreen
+from ui.screens.cert_export import CertExportScreen
 from ui.jogdial import JogDialNavigator
-from usb.detector import USBDetector
-from usb.manager import USBFileManager
-from easyrsa.pki import PKIManager
-from templates.manager import TemplateManager
 from config.settings import settings
 import os
+import time
+
+
+_GIB = 1 << 30
+
+# Shared label prefixes for dynamic rows; plain concatenation with a
+# cached prefix skips the f-string formatting machinery in the loops
+_DRIVE_PREFIX = '💾 '
+_FILE_PREFIX = '📄 '
+
+
+def _dir_names(directory: str) -> set:
+    """Set of entry names in directory; empty if it can't be read."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
 
 
 class USBImportExportScreen(MenuScreen):
     """USB import/export main screen."""
 
+    # Drive scans probe every mount point with write tests; within one
+    # UI transition (enter + menu build) the result can't change, so
+    # repeat calls inside this window reuse the last scan
+    _DRIVE_SCAN_TTL = 1.0
+
+    __slots__ = ('usb_detector', 'usb_manager', 'detected_drives', '_drives_ts',
+                 '_scan_pending', '_drive_menus')
+
     def __init__(self, app, navigator: JogDialNavigator):
         """Initialize USB import/export screen.
 
@@ -21,18 +44,53 @@ class USBImportExportScreen(MenuScreen):
             navigator: Jog-dial navigator instance
         """
         super().__init__(app, navigator, title='USB Import/Export')
-        self.usb_detector = USBDetector()
-        self.usb_manager = USBFileManager()
+        # Shared manager: keeps the drive-listing cache warm across
+        # screen instances; its detector is reused for drive scans
+        self.usb_manager = app.usb_manager
+        self.usb_detector = app.usb_manager.detector
         self.detected_drives = []
+        self._drives_ts = None
+        self._scan_pending = False
+        # Drive menu screens kept per mount path so revisiting a drive
+        # reuses the screen object; entries for unplugged drives are
+        # evicted when a scan lands
+        self._drive_menus = {}
+
+    def _invalidate_drives(self):
+        """Force the next menu build to rescan for drives."""
+        self._drives_ts = None
+        self.usb_detector.invalidate()
+
+    def _start_scan(self):
+        """Kick off a background drive scan, if one isn't running."""
+        if self._scan_pending:
+            return
+        self._scan_pending = True
+        self.run_async(self.usb_detector.detect_usb_drives, self._on_scan_done)
 
-    def enter(self):
-        """Called when screen becomes active."""
-        super().enter()
-        # Detect USB drives
-        self.detected_drives = self.usb_detector.detect_usb_drives()
+    def _on_scan_done(self, drives):
+        """Swap the scan result into the menu on the UI thread.
+
+        Args:
+            drives: List of USB drive mount paths from the background scan
+        """
+        self._scan_pending = False
+        self.detected_drives = drives
+        self._drives_ts = time.monotonic()
+
+        for path in [p for p in self._drive_menus if p not in drives]:
+            del self._drive_menus[path]
+
+        if self.is_active:
+            self._refresh_menu()
 
     def _build_menu_items(self):
-        """Build USB menu items."""
+        """Build USB menu items.
+
+        Drive detection write-tests every mount point, so it runs on a
+        worker thread; the menu paints immediately with a scanning
+        placeholder and repopulates when the scan lands.
+        """
         self.menu_items = [
             {
                 'label': '← Back',
@@ -40,16 +98,22 @@ class USBImportExportScreen(MenuScreen):
             }
         ]
 
-        # Detect USB drives
-        drives = self.usb_detector.detect_usb_drives()
-        self.detected_drives = drives
+        now = time.monotonic()
+        if self._drives_ts is None or now - self._drives_ts >= self._DRIVE_SCAN_TTL:
+            self._start_scan()
 
-        if drives:
-            for drive in drives:
+        if self._scan_pending:
+            self.menu_items.append({
+                'label': '(Scanning for USB drives...)',
+                'action': lambda: None
+            })
+        elif self.detected_drives:
+            for drive in self.detected_drives:
                 drive_name = os.path.basename(drive) or drive
                 self.menu_items.append({
-                    'label': f'💾 {drive_name}',
-                    'action': lambda d=drive: self._show_drive_menu(d)
+                    'label': _DRIVE_PREFIX + drive_name,
+                    'action': self._show_drive_menu,
+                    'arg': drive
                 })
         else:
             self.menu_items.append({
@@ -63,8 +127,14 @@ class USBImportExportScreen(MenuScreen):
         })
 
     def _refresh(self):
-        """Refresh USB drive list."""
-        self.app.show_screen(self)
+        """Rescan drives and update the menu in place.
+
+        Re-showing the whole screen would tear down and rebuild every
+        widget; refreshing the menu reuses them, and MenuList skips the
+        redraw entirely when the labels come back unchanged.
+        """
+        self._invalidate_drives()
+        self._refresh_menu()
 
     def _show_drive_menu(self, drive_path: str):
         """Show menu for specific USB drive.
@@ -73,13 +143,18 @@ class USBImportExportScreen(MenuScreen):
             drive_path: USB drive path
         """
         self.navigator.push_screen(self)
-        drive_menu = USBDriveMenuScreen(self.app, self.navigator, drive_path)
+        drive_menu = self._drive_menus.get(drive_path)
+        if drive_menu is None:
+            drive_menu = USBDriveMenuScreen(self.app, self.navigator, drive_path)
+            self._drive_menus[drive_path] = drive_menu
         self.app.show_screen(drive_menu)
 
 
 class USBDriveMenuScreen(MenuScreen):
     """USB drive operations menu."""
 
+    __slots__ = ('drive_path', 'usb_manager', 'pki_manager', 'template_manager')
+
     def __init__(self, app, navigator: JogDialNavigator, drive_path: str):
         """Initialize USB drive menu.
 
@@ -89,53 +164,32 @@ class USBDriveMenuScreen(MenuScreen):
             drive_path: USB drive path
         """
         self.drive_path = drive_path
-        self.usb_manager = USBFileManager()
-        self.pki_manager = PKIManager()
-        self.template_manager = TemplateManager()
+        self.usb_manager = app.usb_manager
+        self.pki_manager = app.pki_manager
+        self.template_manager = app.template_manager
 
         drive_name = os.path.basename(drive_path) or drive_path
         super().__init__(app, navigator, title=f'USB: {drive_name}')
 
+    # The drive menu is entirely static; one class-level skeleton of
+    # (label, handler attribute) pairs replaces rebuilding the literal
+    # dicts on every menu refresh
+    _STATIC_MENU = (
+        ('← Back', 'go_back'),
+        ('Import Certificate Requests', '_import_requests'),
+        ('Import Templates', '_import_templates'),
+        ('Import vars file', '_import_vars'),
+        ('Export Certificates', '_export_certs'),
+        ('Export Templates', '_export_templates'),
+        ('Export vars file', '_export_vars'),
+        ('Drive Information', '_show_drive_info'),
+        ('Eject Drive', '_eject_drive'),
+    )
+
     def _build_menu_items(self):
-        """Build USB drive menu items."""
-        self.menu_items = [
-            {
-                'label': '← Back',
-                'action': self.go_back
-            },
-            {
-                'label': 'Import Certificate Requests',
-                'action': self._import_requests
-            },
-            {
-                'label': 'Import Templates',
-                'action': self._import_templates
-            },
-            {
-                'label': 'Import vars file',
-                'action': self._import_vars
-            },
-            {
-                'label': 'Export Certificates',
-                'action': self._export_certs
-            },
-            {
-                'label': 'Export Templates',
-                'action': self._export_templates
-            },
-            {
-                'label': 'Export vars file',
-                'action': self._export_vars
-            },
-            {
-                'label': 'Drive Information',
-                'action': self._show_drive_info
-            },
-            {
-                'label': 'Eject Drive',
-                'action': self._eject_drive
-            }
-        ]
+        """Build USB drive menu items from the static skeleton."""
+        self.menu_items = [{'label': label, 'action': getattr(self, attr)}
+                           for label, attr in self._STATIC_MENU]
 
     def _import_requests(self):
         """Import certificate requests from USB."""
@@ -218,7 +272,6 @@ class USBDriveMenuScreen(MenuScreen):
 
         # Show certificate selection
         self.navigator.push_screen(self)
-        from ui.screens.cert_export import CertExportScreen
         export_screen = CertExportScreen(
             self.app,
             self.navigator,
@@ -277,12 +330,36 @@ class USBDriveMenuScreen(MenuScreen):
         )
 
     def _do_eject_drive(self):
-        """Perform the eject and navigate back to the USB list."""
-        success = self.usb_manager.detector.unmount_drive(self.drive_path)
+        """Run the eject on a worker thread.
 
+        umount can block for seconds while dirty buffers flush; the
+        progress indicator keeps the event loop spinning meanwhile.
+        """
+        self._show_progress('Ejecting drive...')
+        self.run_async(self._eject_worker, self._on_eject_done)
+
+    def _eject_worker(self):
+        """Flush and unmount the drive (background thread).
+
+        Returns:
+            True if the drive was ejected
+        """
+        # Flushing first shortens the window where umount itself blocks
+        if hasattr(os, 'sync'):
+            os.sync()
+        return self.usb_manager.detector.unmount_drive(self.drive_path)
+
+    def _on_eject_done(self, success: bool):
+        """Navigate back or report failure once the eject lands.
+
+        Args:
+            success: True if the drive was ejected
+        """
+        self._hide_progress()
         if success:
             # Drive is gone — go back to the USB list screen and show message from there
             usb_list = self.navigator.pop_screen()
+            usb_list._invalidate_drives()
             self.app.show_screen(usb_list)
             usb_list.show_message('Ejected', 'Drive ejected safely.\n\nYou can now remove it.')
         else:
@@ -294,14 +371,19 @@ class USBDriveMenuScreen(MenuScreen):
         pki_info = self.pki_manager.get_pki_info()
         easyrsa_dir = os.path.dirname(settings.easyrsa_bin)
 
-        # Look for vars in PKI dir first (easy-rsa 3.x), then easy-rsa dir
-        candidates = [
-            os.path.join(pki_info.pki_dir, 'vars'),
-            os.path.join(easyrsa_dir, 'vars'),
-            os.path.join(easyrsa_dir, 'vars.example'),
-        ]
-
-        vars_path = next((p for p in candidates if os.path.exists(p)), None)
+        # Look for vars in PKI dir first (easy-rsa 3.x), then easy-rsa
+        # dir; one scandir per directory instead of a stat per candidate
+        pki_names = _dir_names(pki_info.pki_dir)
+        easyrsa_names = _dir_names(easyrsa_dir)
+
+        if 'vars' in pki_names:
+            vars_path = os.path.join(pki_info.pki_dir, 'vars')
+        elif 'vars' in easyrsa_names:
+            vars_path = os.path.join(easyrsa_dir, 'vars')
+        elif 'vars.example' in easyrsa_names:
+            vars_path = os.path.join(easyrsa_dir, 'vars.example')
+        else:
+            vars_path = None
 
         if not vars_path:
             self.show_message('Not Found',
@@ -347,13 +429,8 @@ class USBDriveMenuScreen(MenuScreen):
         else:
             dest_dir = os.path.dirname(settings.easyrsa_bin)
 
-        dest_path = os.path.join(dest_dir, 'vars')
-        if self.usb_manager.import_file(vars_file, dest_dir, 'vars'):
-            # vars file may contain secrets — restrict to owner read/write only
-            try:
-                os.chmod(dest_path, 0o600)
-            except OSError:
-                pass
+        # vars file may contain secrets — created owner read/write only
+        if self.usb_manager.import_file(vars_file, dest_dir, 'vars', mode=0o600):
             self.show_message('Success', f'vars file imported to:\n\n{dest_dir}')
         else:
             self.show_message('Error', 'Failed to import vars file')
@@ -362,6 +439,14 @@ class USBDriveMenuScreen(MenuScreen):
         """Show USB drive information."""
         info = self.usb_manager.detector.get_drive_info(self.drive_path)
 
+        if 'total_space' in info:
+            space_block = (f"\nSpace:\n"
+                           f"- Total: {info['total_space'] / _GIB:.2f} GB\n"
+                           f"- Used: {info['used_space'] / _GIB:.2f} GB\n"
+                           f"- Free: {info['free_space'] / _GIB:.2f} GB\n")
+        else:
+            space_block = ''
+
         details = f"""USB Drive Information
 
 Path: {info['path']}
@@ -370,19 +455,7 @@ Label: {info.get('label', 'Unknown')}
 Status:
 - Mounted: {'Yes' if info.get('mount') else 'No'}
 - Writable: {'Yes' if info.get('writable') else 'No'}
-"""
-
-        if 'total_space' in info:
-            total_gb = info['total_space'] / (1024**3)
-            free_gb = info['free_space'] / (1024**3)
-            used_gb = info['used_space'] / (1024**3)
-
-            details += f"""
-Space:
-- Total: {total_gb:.2f} GB
-- Used: {used_gb:.2f} GB
-- Free: {free_gb:.2f} GB
-"""
+{space_block}"""
 
         self.show_message('Drive Information', details)
 
@@ -390,6 +463,8 @@ Space:
 class FileSelectScreen(MenuScreen):
     """File selection screen for import operations."""
 
+    __slots__ = ('files', 'on_select_callback')
+
     def __init__(self, app, navigator: JogDialNavigator, title: str, files: list, on_select=None):
         """Initialize file select screen.
 
@@ -413,11 +488,23 @@ class FileSelectScreen(MenuScreen):
             }
         ]
 
+        if not self.files:
+            return
+
+        # All files share the listing root; strip it once with a slice
+        # per entry instead of an os.path.basename call per entry.
+        # Files from different subdirectories keep the relative path
+        # that tells them apart.
+        common = os.path.commonpath([os.path.dirname(f) for f in self.files])
+        prefix_len = len(common.rstrip(os.sep)) + 1
+
+        # One shared bound method dispatched with 'arg' — no closure
+        # allocated per file on big listings
         for file_path in self.files:
-            filename = os.path.basename(file_path)
             self.menu_items.append({
-                'label': f'📄 {filename}',
-                'action': lambda f=file_path: self._select_file(f)
+                'label': _FILE_PREFIX + file_path[prefix_len:],
+                'action': self._select_file,
+                'arg': file_path
             })
 
     def _select_file(self, file_path: str):
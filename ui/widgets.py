@@ -1,9 +1,7 @@
 """Custom widgets optimized for small display and jog-dial navigation."""
 
 import tkinter as tk
-from tkinter import font
-from typing import List, Callable, Optional, Any
-from config.settings import settings
+from typing import List, Callable, Optional
 
 
 class MenuList(tk.Frame):
@@ -20,10 +18,11 @@ class MenuList(tk.Frame):
         super().__init__(parent, bg='white')
         self.visible_items = visible_items
         self.item_height = item_height
-        self.items: List[str] = []
+        self.items: tuple = ()
         self.current_index = 0
         self.scroll_offset = 0
         self.item_labels: List[tk.Label] = []
+        self._batch_depth = 0
 
         self._setup_ui()
 
@@ -40,7 +39,7 @@ class MenuList(tk.Frame):
                 text='',
                 bg='white',
                 fg='black',
-                font=('DejaVu Sans', settings.get('font.size_normal', 10)),
+                font='normalFont',
                 anchor='w',
                 padx=10,
                 height=2,
@@ -49,16 +48,37 @@ class MenuList(tk.Frame):
             label.pack(fill=tk.X)
             self.item_labels.append(label)
 
-    def set_items(self, items: List[str]):
+        # Cache Tcl pathnames and restyle fragments once; selection updates
+        # run as a single interpreter eval instead of per-row config calls
+        self._label_paths = tuple(str(label) for label in self.item_labels)
+        self._style_selected = '-bg #3498db -fg white -font normalBoldFont'
+        self._style_normal = '-bg white -fg black -font normalFont'
+        self._last_texts = [''] * self.visible_items
+        # Labels start in the normal style; tracked per row so restyles
+        # only touch rows whose selected-state actually flipped
+        self._row_selected = [False] * self.visible_items
+
+    def begin_batch(self):
+        """Defer redraws until the matching end_batch (reentrant)."""
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """Close a batch; the outermost close triggers one redraw."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._update_display()
+
+    def set_items(self, items):
         """Set list items.
 
         Args:
-            items: List of item strings to display
+            items: Sequence of item strings to display
         """
-        self.items = items
+        self.items = tuple(items)
         self.current_index = 0
         self.scroll_offset = 0
-        self._update_display()
+        if not self._batch_depth:
+            self._update_display()
 
     def set_selection(self, index: int):
         """Set selected item index.
@@ -69,7 +89,8 @@ class MenuList(tk.Frame):
         if 0 <= index < len(self.items):
             self.current_index = index
             self._adjust_scroll()
-            self._update_display()
+            if not self._batch_depth:
+                self._update_display()
 
     def _adjust_scroll(self):
         """Adjust scroll offset based on current selection."""
@@ -80,31 +101,55 @@ class MenuList(tk.Frame):
 
     def _update_display(self):
         """Update the display of visible items."""
-        for i, label in enumerate(self.item_labels):
-            item_index = self.scroll_offset + i
+        start = self.scroll_offset
+        visible = self.items[start:start + self.visible_items]
+        self.render_window(visible, self.current_index - start)
 
-            if item_index < len(self.items):
-                label.config(text=self.items[item_index])
+    def render_window(self, visible_labels: List[str], selected_local_index: int):
+        """Redraw only the visible window of rows.
 
-                # Highlight current item
-                if item_index == self.current_index:
-                    label.config(bg='#3498db', fg='white', font=('DejaVu Sans', settings.get('font.size_normal', 10), 'bold'))
-                else:
-                    label.config(bg='white', fg='black', font=('DejaVu Sans', settings.get('font.size_normal', 10)))
-            else:
-                label.config(text='', bg='white')
+        The widget holds exactly visible_items labels, and both texts
+        and selection styling are diffed against the last paint, so a
+        plain jog-dial step restyles just the two rows that swapped
+        highlight and touches no others.
+
+        Args:
+            visible_labels: Item strings for the visible window, in order
+            selected_local_index: Selected row within the window (or -1)
+        """
+        n_visible = len(visible_labels)
+        script_parts = []
+        for i, path in enumerate(self._label_paths):
+            text = visible_labels[i] if i < n_visible else ''
+            if text != self._last_texts[i]:
+                self.item_labels[i].config(text=text)
+                self._last_texts[i] = text
+
+            selected = (i == selected_local_index and i < n_visible)
+            if selected != self._row_selected[i]:
+                self._row_selected[i] = selected
+                script_parts.append(path + ' configure ' + (
+                    self._style_selected if selected else self._style_normal))
+
+        if script_parts:
+            self.tk.eval(';'.join(script_parts))
 
     def clear(self):
         """Clear all items."""
-        self.items = []
+        self.items = ()
         self.current_index = 0
         self.scroll_offset = 0
-        self._update_display()
+        if not self._batch_depth:
+            self._update_display()
 
 
 class InfoPanel(tk.Frame):
     """Panel for displaying read-only information."""
 
+    # Large texts are inserted in slices of this many characters so a
+    # big log or details dump never blocks the jog-dial in one edit
+    _INSERT_CHUNK = 4096
+
     def __init__(self, parent, title: str = ''):
         """Initialize info panel.
 
@@ -114,6 +159,9 @@ class InfoPanel(tk.Frame):
         """
         super().__init__(parent, bg='white', relief=tk.RAISED, bd=1)
         self.title = title
+        self._current_text = ''
+        self._pending_tail = ''
+        self._pending_insert_id = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -124,7 +172,7 @@ class InfoPanel(tk.Frame):
                 text=self.title,
                 bg='#34495e',
                 fg='white',
-                font=('DejaVu Sans', settings.get('font.size_large', 12), 'bold'),
+                font='titleFont',
                 anchor='w',
                 padx=10,
                 pady=5
@@ -143,7 +191,7 @@ class InfoPanel(tk.Frame):
             wrap=tk.WORD,
             bg='white',
             fg='black',
-            font=('DejaVu Sans Mono', settings.get('font.size_small', 8)),
+            font='monoFont',
             yscrollcommand=scrollbar.set,
             relief=tk.FLAT,
             padx=10,
@@ -157,27 +205,74 @@ class InfoPanel(tk.Frame):
     def set_text(self, text: str):
         """Set panel text content.
 
+        A no-op when the content is unchanged, so polling refreshes
+        don't rebuild the Text widget; otherwise the content is
+        swapped in a single replace edit rather than delete + insert.
+
         Args:
             text: Text to display
         """
+        if text == self._current_text:
+            return
+
+        self._cancel_pending_insert()
+        self._current_text = text
         self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.delete(1.0, tk.END)
-        self.text_widget.insert(1.0, text)
+        self.text_widget.replace('1.0', tk.END, text[:self._INSERT_CHUNK])
         self.text_widget.config(state=tk.DISABLED)
 
+        # The first chunk is visible immediately; the rest streams in
+        # one chunk per idle pass, interleaved with input events
+        if len(text) > self._INSERT_CHUNK:
+            self._pending_tail = text[self._INSERT_CHUNK:]
+            self._pending_insert_id = self.text_widget.after_idle(self._insert_tail_chunk)
+
+    def _insert_tail_chunk(self):
+        """Insert the next pending chunk and reschedule if more remain."""
+        self._pending_insert_id = None
+        chunk = self._pending_tail[:self._INSERT_CHUNK]
+        self._pending_tail = self._pending_tail[self._INSERT_CHUNK:]
+
+        self.text_widget.config(state=tk.NORMAL)
+        self.text_widget.insert(tk.END, chunk)
+        self.text_widget.config(state=tk.DISABLED)
+
+        if self._pending_tail:
+            self._pending_insert_id = self.text_widget.after_idle(self._insert_tail_chunk)
+
+    def _cancel_pending_insert(self):
+        """Drop any chunked insert still in flight."""
+        if self._pending_insert_id is not None:
+            self.text_widget.after_cancel(self._pending_insert_id)
+            self._pending_insert_id = None
+            self._pending_tail = ''
+
     def append_text(self, text: str):
         """Append text to panel.
 
         Args:
             text: Text to append
         """
+        self._current_text += text
+
+        # While a chunked fill is streaming, queue behind it so the
+        # appended text lands in order
+        if self._pending_insert_id is not None:
+            self._pending_tail += text
+            return
+
         self.text_widget.config(state=tk.NORMAL)
         self.text_widget.insert(tk.END, text)
         self.text_widget.config(state=tk.DISABLED)
         self.text_widget.see(tk.END)
 
     def clear(self):
-        """Clear panel text."""
+        """Clear panel text (a no-op when already empty)."""
+        if not self._current_text:
+            return
+
+        self._cancel_pending_insert()
+        self._current_text = ''
         self.text_widget.config(state=tk.NORMAL)
         self.text_widget.delete(1.0, tk.END)
         self.text_widget.config(state=tk.DISABLED)
@@ -202,7 +297,7 @@ class ProgressIndicator(tk.Frame):
             text='',
             bg='white',
             fg='#2c3e50',
-            font=('DejaVu Sans', settings.get('font.size_normal', 10)),
+            font='normalFont',
             anchor='center'
         )
         self.label.pack(pady=10)
@@ -215,16 +310,29 @@ class ProgressIndicator(tk.Frame):
         )
         self.progress_bar.pack(fill=tk.X, padx=20, pady=5)
 
+        # Persistent canvas items: paints move their coords instead of
+        # delete('all') + re-creating two rectangles each time
+        self._bg_rect = self.progress_bar.create_rectangle(
+            0, 0, 0, 20, fill='#ecf0f1', outline='#bdc3c7')
+        self._fg_rect = self.progress_bar.create_rectangle(
+            0, 0, 0, 20, fill='#3498db', outline='')
+        self.progress_bar.bind('<Configure>', self._on_canvas_resize)
+
         self.status_label = tk.Label(
             self,
             text='',
             bg='white',
             fg='#7f8c8d',
-            font=('DejaVu Sans', settings.get('font.size_small', 8)),
+            font='smallFont',
             anchor='center'
         )
         self.status_label.pack(pady=5)
 
+        # Coalescing state: set_progress records the latest value and
+        # one idle callback paints it
+        self._pending_percent = 0.0
+        self._draw_scheduled = False
+
     def set_message(self, message: str):
         """Set progress message.
 
@@ -236,28 +344,49 @@ class ProgressIndicator(tk.Frame):
     def set_progress(self, percent: float):
         """Set progress percentage.
 
+        Calls are coalesced: only the most recent value is painted,
+        once, at idle time — a caller ticking faster than the event
+        loop costs one redraw per pass instead of one per call, and
+        the canvas is guaranteed to be laid out by then. Callers
+        needing a synchronous paint should call update_idletasks() —
+        never update(), which forces a full event-loop pass.
+
         Args:
             percent: Progress percentage (0-100)
         """
-        self.progress_bar.delete('all')
-        width = self.progress_bar.winfo_width()
-        if width <= 1:
-            width = 320
-
-        # Draw background
-        self.progress_bar.create_rectangle(
-            0, 0, width, 20,
-            fill='#ecf0f1',
-            outline='#bdc3c7'
-        )
+        self._pending_percent = percent
+        if not self._draw_scheduled:
+            self._draw_scheduled = True
+            self.progress_bar.after_idle(self._flush_progress)
 
-        # Draw progress
-        progress_width = int(width * (percent / 100))
-        self.progress_bar.create_rectangle(
-            0, 0, progress_width, 20,
-            fill='#3498db',
-            outline=''
-        )
+    def _flush_progress(self):
+        """Paint the latest coalesced percent."""
+        self._draw_scheduled = False
+        self._draw_progress(self._pending_percent)
+
+    def _draw_progress(self, percent: float, width: Optional[int] = None):
+        """Move the persistent rectangles to show percent.
+
+        Args:
+            percent: Progress percentage (0-100)
+            width: Canvas width; measured here when deferred
+        """
+        if width is None:
+            width = self.progress_bar.winfo_width()
+            if width <= 1:
+                # Still unmapped at idle time; draw at the design width
+                width = 320
+
+        self.progress_bar.coords(self._bg_rect, 0, 0, width, 20)
+        self.progress_bar.coords(self._fg_rect, 0, 0, int(width * (percent / 100)), 20)
+
+    def _on_canvas_resize(self, event):
+        """Re-fit the rectangles to the new canvas width.
+
+        Args:
+            event: Tk <Configure> event carrying the new width
+        """
+        self._draw_progress(self._pending_percent, event.width)
 
     def set_status(self, status: str):
         """Set status text.
@@ -284,9 +413,18 @@ class ProgressIndicator(tk.Frame):
 
 
 class MessageBox(tk.Toplevel):
-    """Modal message box for confirmations and alerts."""
+    """Modal message box for confirmations and alerts.
+
+    The dialog never blocks the event loop: button presses hide the
+    window and fire the on_result callback. Use MessageBox.show() to
+    reuse one cached Toplevel via withdraw/deiconify instead of paying
+    for a new window per dialog.
+    """
+
+    _cached: Optional['MessageBox'] = None
 
-    def __init__(self, parent, title: str, message: str, buttons: List[str] = None):
+    def __init__(self, parent, title: str, message: str, buttons: List[str] = None,
+                 on_result: Optional[Callable[[str], None]] = None):
         """Initialize message box.
 
         Args:
@@ -294,9 +432,11 @@ class MessageBox(tk.Toplevel):
             title: Dialog title
             message: Message to display
             buttons: List of button labels (default: ['OK'])
+            on_result: Callback invoked with the pressed button label
         """
         super().__init__(parent)
         self.result = None
+        self.on_result = on_result
         self.buttons_list = buttons or ['OK']
 
         self.title(title)
@@ -310,6 +450,52 @@ class MessageBox(tk.Toplevel):
 
         self._setup_ui(title, message)
 
+    @classmethod
+    def show(cls, parent, title: str, message: str, buttons: List[str] = None,
+             on_result: Optional[Callable[[str], None]] = None) -> 'MessageBox':
+        """Show a message box, reusing a single cached dialog window.
+
+        Args:
+            parent: Parent widget
+            title: Dialog title
+            message: Message to display
+            buttons: List of button labels (default: ['OK'])
+            on_result: Callback invoked with the pressed button label
+
+        Returns:
+            The displayed MessageBox
+        """
+        box = cls._cached
+        if box is None or not box.winfo_exists():
+            box = cls(parent, title, message, buttons, on_result)
+            cls._cached = box
+        else:
+            box.configure_for(title, message, buttons)
+            box.on_result = on_result
+            box.deiconify()
+            box.grab_set()
+        return box
+
+    def configure_for(self, title: str, message: str, buttons: List[str] = None):
+        """Retarget the cached dialog to new content.
+
+        Args:
+            title: Dialog title
+            message: Message to display
+            buttons: List of button labels (default: ['OK'])
+        """
+        self.result = None
+        self.title(title)
+        self._title_label.config(text=title)
+        self._message_label.config(text=message)
+
+        buttons = buttons or ['OK']
+        if buttons != self.buttons_list:
+            self.buttons_list = buttons
+            for child in self._button_frame.winfo_children():
+                child.destroy()
+            self._build_buttons()
+
     def _setup_ui(self, title: str, message: str):
         """Set up message box UI.
 
@@ -318,41 +504,44 @@ class MessageBox(tk.Toplevel):
             message: Message text
         """
         # Title
-        title_label = tk.Label(
+        self._title_label = tk.Label(
             self,
             text=title,
             bg='#34495e',
             fg='white',
-            font=('DejaVu Sans', settings.get('font.size_large', 12), 'bold'),
+            font='titleFont',
             pady=10
         )
-        title_label.pack(fill=tk.X)
+        self._title_label.pack(fill=tk.X)
 
         # Message
-        message_label = tk.Label(
+        self._message_label = tk.Label(
             self,
             text=message,
             bg='white',
             fg='#2c3e50',
-            font=('DejaVu Sans', settings.get('font.size_normal', 10)),
+            font='normalFont',
             wraplength=350,
             justify=tk.CENTER,
             pady=20
         )
-        message_label.pack(fill=tk.BOTH, expand=True)
+        self._message_label.pack(fill=tk.BOTH, expand=True)
 
         # Buttons
-        button_frame = tk.Frame(self, bg='white')
-        button_frame.pack(pady=10)
+        self._button_frame = tk.Frame(self, bg='white')
+        self._button_frame.pack(pady=10)
+        self._build_buttons()
 
+    def _build_buttons(self):
+        """Create buttons for the current button list."""
         for btn_text in self.buttons_list:
             btn = tk.Button(
-                button_frame,
+                self._button_frame,
                 text=btn_text,
                 command=lambda t=btn_text: self._on_button(t),
                 bg='#3498db',
                 fg='white',
-                font=('DejaVu Sans', settings.get('font.size_normal', 10)),
+                font='normalFont',
                 padx=20,
                 pady=5
             )
@@ -365,13 +554,7 @@ class MessageBox(tk.Toplevel):
             button_text: Text of clicked button
         """
         self.result = button_text
-        self.destroy()
-
-    def get_result(self) -> Optional[str]:
-        """Get dialog result.
-
-        Returns:
-            Selected button text or None
-        """
-        self.wait_window()
-        return self.result
+        self.grab_release()
+        self.withdraw()
+        if self.on_result:
+            self.on_result(button_text)
@@ -2,13 +2,62 @@
 
 import os
 import platform
+import string
+import time
 from pathlib import Path
 from typing import List, Optional
 
+# The platform never changes at runtime; resolve it once at import time
+_SYSTEM = platform.system()
+
+# Candidate removable drive roots on Windows (C: is never removable)
+_WIN_DRIVE_PATHS = tuple(
+    f'{letter}:\\' for letter in string.ascii_uppercase if letter != 'C'
+)
+
+
+def _mountinfo_mount_points() -> Optional[List[str]]:
+    """Read the active mount points from /proc/self/mountinfo.
+
+    One small procfs read replaces a stat storm: probing candidate
+    directories with os.path.ismount stats every entry under every
+    mount base, which on a Pi with an automounter can take hundreds of
+    syscalls per detection pass.
+
+    Returns:
+        Mount point paths, or None where mountinfo is unavailable
+    """
+    try:
+        with open('/proc/self/mountinfo', 'r') as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+
+    mounts = []
+    for line in lines:
+        fields = line.split(' ')
+        if len(fields) < 5:
+            continue
+        # Field 5 is the mount point, with space/tab/backslash escaped
+        # as octal sequences
+        mount_point = fields[4]
+        if '\\' in mount_point:
+            mount_point = (mount_point
+                           .replace('\\040', ' ')
+                           .replace('\\011', '\t')
+                           .replace('\\134', '\\'))
+        mounts.append(mount_point)
+
+    return mounts
+
 
 class USBDetector:
     """USB drive detector for Raspberry Pi."""
 
+    # Detection results stay valid this long; callers polling faster
+    # (several screens share one detector) reuse the last answer
+    _CACHE_TTL = 0.5
+
     def __init__(self, mount_points: Optional[List[str]] = None):
         """Initialize USB detector.
 
@@ -21,26 +70,73 @@ class USBDetector:
             mount_points = settings.usb_mount_points
 
         self.mount_points = mount_points
-        self.system = platform.system()
+        self.system = _SYSTEM
+        self._cache: Optional[List[str]] = None
+        self._cache_ts = 0.0
+
+    def invalidate(self):
+        """Drop the cached detection result.
+
+        Call after an operation known to change the mount table (eject,
+        a user-reported insertion) so the next detect is fresh.
+        """
+        self._cache = None
 
     def detect_usb_drives(self) -> List[str]:
         """Detect mounted USB drives.
 
+        Results are cached for a short TTL so multiple screens polling
+        the shared detector don't multiply the mount-table work.
+
         Returns:
             List of USB drive mount paths
         """
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < self._CACHE_TTL:
+            return list(self._cache)
+
         if self.system == 'Linux':
-            return self._detect_linux()
+            drives = self._detect_linux()
         elif self.system == 'Windows':
-            return self._detect_windows()
+            drives = self._detect_windows()
         elif self.system == 'Darwin':  # macOS
-            return self._detect_macos()
+            drives = self._detect_macos()
         else:
-            return []
+            drives = []
+
+        self._cache = drives
+        self._cache_ts = now
+        return list(drives)
 
     def _detect_linux(self) -> List[str]:
         """Detect USB drives on Linux.
 
+        The mount table comes from /proc/self/mountinfo and is filtered
+        against the configured mount bases, so nothing is stat'd except
+        actual mounts; the directory-probing scan remains as a fallback
+        for the unlikely case procfs is unavailable.
+
+        Returns:
+            List of mount paths
+        """
+        mounts = _mountinfo_mount_points()
+        if mounts is None:
+            return self._detect_linux_scan()
+
+        drives = []
+        for mount_point in mounts:
+            for mount_base in self.mount_points:
+                if mount_point == mount_base or \
+                        mount_point.startswith(mount_base.rstrip('/') + '/'):
+                    if mount_point not in drives and self._is_writable(mount_point):
+                        drives.append(mount_point)
+                    break
+
+        return drives
+
+    def _detect_linux_scan(self) -> List[str]:
+        """Detect USB drives on Linux by probing mount base directories.
+
         Returns:
             List of mount paths
         """
@@ -74,19 +170,14 @@ class USBDetector:
         Returns:
             List of drive letters
         """
-        import string
-
         drives = []
 
-        # Check all possible drive letters
-        for letter in string.ascii_uppercase:
-            drive_path = f'{letter}:\\'
-
+        # Check all candidate drive letters
+        for drive_path in _WIN_DRIVE_PATHS:
             if os.path.exists(drive_path):
-                # Check if it's a removable drive
+                # Simple heuristic: a removable drive is one we can write to
                 try:
-                    # Simple heuristic: if we can write to it and it's not C:
-                    if letter != 'C' and self._is_writable(drive_path):
+                    if self._is_writable(drive_path):
                         drives.append(drive_path)
                 except:
                     continue
@@ -123,6 +214,25 @@ class USBDetector:
     def _is_writable(self, path: str) -> bool:
         """Check if path is writable.
 
+        A permission check only — no I/O. Detection passes run this for
+        every mount, and writing a probe file to every attached drive
+        on each pass spun up flash media and wore it for no reason.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if writable
+        """
+        return os.access(path, os.W_OK)
+
+    def _is_writable_strict(self, path: str) -> bool:
+        """Check writability by actually writing a probe file.
+
+        Catches read-only filesystems and full media that os.access
+        can't see; reserved for one-off queries like get_drive_info,
+        never the periodic detection pass.
+
         Args:
             path: Path to check
 
@@ -153,14 +263,25 @@ class USBDetector:
         Returns:
             Dictionary with drive information
         """
+        # One stat decides existence; a drive that's gone (just yanked)
+        # skips the write probe, mount check and statvfs entirely
+        try:
+            os.stat(drive_path)
+            exists = True
+        except OSError:
+            exists = False
+
         info = {
             'path': drive_path,
-            'exists': os.path.exists(drive_path),
-            'writable': self._is_writable(drive_path),
-            'mount': os.path.ismount(drive_path),
+            'exists': exists,
+            'writable': exists and self._is_writable_strict(drive_path),
+            'mount': exists and os.path.ismount(drive_path),
             'label': os.path.basename(drive_path)
         }
 
+        if not exists:
+            return info
+
         # Try to get space info
         try:
             stat = os.statvfs(drive_path) if hasattr(os, 'statvfs') else None
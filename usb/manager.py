@@ -1,21 +1,129 @@
 """USB file manager for import/export operations."""
 
+import fnmatch
 import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from usb.detector import USBDetector
 
 
+def _advise_sequential_read(path: str):
+    """Hint kernel readahead that path will be read once, sequentially.
+
+    On slow USB media the copy otherwise stalls block by block; with
+    the advice, readahead prefetches in front of the copy loop.
+    Best-effort: a no-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _drop_page_cache(path: str):
+    """Tell the kernel the file's cached pages won't be read again.
+
+    Exported data is written once and never read back, but left alone
+    it sits in the page cache evicting pages the UI still needs.
+    Best-effort: a no-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _copy_file(source_path: str, dest_path: str, mode: Optional[int] = None):
+    """Copy source to dest, preferring an in-kernel data path.
+
+    os.copy_file_range moves the bytes without any userspace buffer;
+    where the kernel or filesystem refuses (non-Linux, old kernels,
+    some cross-device cases) the copy falls back to shutil.copyfile.
+    Only the timestamps are carried over — one utime call, instead of
+    copystat's permission/xattr/flags cascade, which also propagated
+    the bogus 0o777 bits FAT USB media reports.
+
+    When mode is given, the destination is created with it from the
+    first byte, so secret-bearing files are never observable with
+    wider permissions between creation and a later chmod.
+    """
+    opener = None
+    if mode is not None:
+        def opener(path, flags):
+            return os.open(path, flags, mode)
+
+    try:
+        with open(source_path, 'rb') as src, \
+                open(dest_path, 'wb', opener=opener) as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except (AttributeError, OSError):
+        shutil.copyfile(source_path, dest_path)
+
+    st = os.stat(source_path)
+    os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    if mode is not None:
+        os.chmod(dest_path, mode)
+
+
 class USBFileManager:
     """Manager for USB file operations."""
 
     def __init__(self):
         """Initialize USB file manager."""
         self.detector = USBDetector()
+        # Listing caches validated against the drive root's mtime so
+        # repeated menu builds don't re-walk the drive: one keyed on
+        # (usb_path, pattern) for ad-hoc listings, one per drive for
+        # the classified scan_drive result
+        self._list_cache: Dict[Tuple[str, str], Tuple[int, List[str]]] = {}
+        self._scan_cache: Dict[str, Tuple[int, Dict[str, List[str]]]] = {}
+
+    def invalidate(self):
+        """Drop cached drive listings.
+
+        The mtime key only tracks the drive root, so call this after
+        any operation that may have written into a subdirectory.
+        """
+        self._list_cache = {}
+        self._scan_cache = {}
 
     def list_files(self, usb_path: str, pattern: str = '*') -> List[str]:
-        """List files on USB drive.
+        """List files on USB drive, recursing into subdirectories.
+
+        Use list_files_shallow when only the drive root matters.
+
+        Results are cached against the drive root's mtime; writes below
+        the root need an explicit invalidate() to be picked up.
 
         Args:
             usb_path: USB drive path
@@ -24,30 +132,51 @@ class USBFileManager:
         Returns:
             List of file paths
         """
-        if not os.path.exists(usb_path):
-            return []
-
         try:
-            path = Path(usb_path)
-            files = []
-
-            # Search recursively for matching files
-            for file_path in path.rglob(pattern):
-                if file_path.is_file():
-                    files.append(str(file_path))
-
-            return sorted(files)
-
-        except PermissionError:
+            dir_mtime = os.stat(usb_path).st_mtime_ns
+        except OSError:
             return []
 
-    def import_file(self, source_path: str, dest_dir: str, filename: Optional[str] = None) -> bool:
+        key = (usb_path, pattern)
+        cached = self._list_cache.get(key)
+        if cached is not None and cached[0] == dir_mtime:
+            return list(cached[1])
+
+        # Walk with scandir directly: DirEntry answers is_file from the
+        # readdir data, where Path.rglob stats every entry again —
+        # roughly twice the syscalls on slow USB media
+        match = None if pattern == '*' else re.compile(fnmatch.translate(pattern)).match
+        files = []
+        pending = [usb_path]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if match is None or match(entry.name):
+                                files.append(entry.path)
+            except OSError:
+                # Unreadable subdirectory (or yanked drive); keep what we have
+                continue
+
+        files.sort()
+
+        self._list_cache[key] = (dir_mtime, files)
+        return list(files)
+
+    def import_file(self, source_path: str, dest_dir: str, filename: Optional[str] = None,
+                    mode: Optional[int] = None) -> bool:
         """Import file from USB to local directory.
 
         Args:
             source_path: Source file path on USB
             dest_dir: Destination directory
             filename: Optional new filename (default: keep original)
+            mode: Optional permission bits the destination is created
+                with (e.g. 0o600 for secret-bearing files)
 
         Returns:
             True if imported successfully
@@ -65,8 +194,9 @@ class USBFileManager:
 
             dest_path = os.path.join(dest_dir, filename)
 
-            # Copy file
-            shutil.copy2(source_path, dest_path)
+            # Copy file (source usually lives on slow USB media)
+            _advise_sequential_read(source_path)
+            _copy_file(source_path, dest_path, mode)
 
             return True
 
@@ -98,9 +228,13 @@ class USBFileManager:
 
             dest_path = os.path.join(usb_path, filename)
 
-            # Copy file
-            shutil.copy2(source_path, dest_path)
+            # Copy file, then release its one-shot pages so the export
+            # doesn't evict hot UI pages from the cache
+            _copy_file(source_path, dest_path)
+            _drop_page_cache(dest_path)
 
+            # The drive's contents changed; drop cached listings
+            self.invalidate()
             return True
 
         except Exception as e:
@@ -153,8 +287,6 @@ class USBFileManager:
         Returns:
             True if all files exported
         """
-        success = True
-
         # Create bundle directory on USB
         bundle_dir = os.path.join(usb_path, bundle_name)
 
@@ -163,19 +295,25 @@ class USBFileManager:
         except:
             return False
 
-        # Export certificate
+        exports = []
         if cert_path and os.path.exists(cert_path):
-            success &= self.export_file(cert_path, bundle_dir, f'{bundle_name}.crt')
-
-        # Export key
+            exports.append((cert_path, f'{bundle_name}.crt'))
         if key_path and os.path.exists(key_path):
-            success &= self.export_file(key_path, bundle_dir, f'{bundle_name}.key')
-
-        # Export CA cert
+            exports.append((key_path, f'{bundle_name}.key'))
         if ca_path and os.path.exists(ca_path):
-            success &= self.export_file(ca_path, bundle_dir, 'ca.crt')
+            exports.append((ca_path, 'ca.crt'))
+
+        if not exports:
+            return True
 
-        return success
+        # The copies release the GIL in the kernel, so overlapping them
+        # hides per-file metadata latency on slow USB writes
+        with ThreadPoolExecutor(max_workers=len(exports)) as pool:
+            futures = [
+                pool.submit(self.export_file, source, bundle_dir, filename)
+                for source, filename in exports
+            ]
+            return all(future.result() for future in futures)
 
     def import_template(self, vars_file: str, template_dir: str) -> Optional[str]:
         """Import template vars file.
@@ -197,27 +335,108 @@ class USBFileManager:
 
         return None
 
+    def scan_drive(self, usb_path: str) -> Dict[str, List[str]]:
+        """Classify importable files on a drive in one walk.
+
+        One os.walk pass buckets certificate requests (.req), templates
+        (.vars) and vars configs (vars, vars.example, *.vars) together
+        instead of a full drive walk per file kind. The result is
+        cached against the drive root's mtime like list_files.
+
+        Args:
+            usb_path: USB drive path
+
+        Returns:
+            Dict with 'reqs', 'templates' and 'vars' path lists
+        """
+        try:
+            dir_mtime = os.stat(usb_path).st_mtime_ns
+        except OSError:
+            return {'reqs': [], 'templates': [], 'vars': []}
+
+        cached = self._scan_cache.get(usb_path)
+        if cached is not None and cached[0] == dir_mtime:
+            return {kind: list(paths) for kind, paths in cached[1].items()}
+
+        result = {'reqs': [], 'templates': [], 'vars': []}
+        for dirpath, _dirnames, filenames in os.walk(usb_path):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                if name.endswith('.req'):
+                    result['reqs'].append(path)
+                elif name.endswith('.vars'):
+                    result['templates'].append(path)
+                    result['vars'].append(path)
+                elif name in ('vars', 'vars.example'):
+                    result['vars'].append(path)
+
+        for paths in result.values():
+            paths.sort()
+
+        self._scan_cache[usb_path] = (dir_mtime, result)
+        return {kind: list(paths) for kind, paths in result.items()}
+
+    def list_files_shallow(self, usb_path: str, suffix: str) -> List[str]:
+        """List matching files in the drive root only — no recursion.
+
+        One scandir of the root, for callers that almost always find
+        their files there and shouldn't pay for a walk of whatever else
+        lives on the drive.
+
+        Args:
+            usb_path: USB drive path
+            suffix: Filename suffix to match (e.g. '.req')
+
+        Returns:
+            List of file paths, sorted
+        """
+        files = []
+        try:
+            with os.scandir(usb_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix) and \
+                            entry.is_file(follow_symlinks=False):
+                        files.append(entry.path)
+        except OSError:
+            return []
+
+        files.sort()
+        return files
+
     def list_certificate_requests(self, usb_path: str) -> List[str]:
         """List certificate request files on USB.
 
+        Checks the drive root first — where users keep them — and only
+        falls back to the full classified scan when the root has none,
+        so drives full of unrelated files aren't walked for nothing.
+
         Args:
             usb_path: USB drive path
 
         Returns:
             List of .req file paths
         """
-        return self.list_files(usb_path, '*.req')
+        files = self.list_files_shallow(usb_path, '.req')
+        if files:
+            return files
+        return self.scan_drive(usb_path)['reqs']
 
     def list_templates(self, usb_path: str) -> List[str]:
         """List template files on USB.
 
+        Root-first like list_certificate_requests, falling back to the
+        full scan when no .vars files sit in the drive root.
+
         Args:
             usb_path: USB drive path
 
         Returns:
             List of .vars file paths
         """
-        return self.list_files(usb_path, '*.vars')
+        files = self.list_files_shallow(usb_path, '.vars')
+        if files:
+            return files
+        return self.scan_drive(usb_path)['templates']
 
     def list_vars_files(self, usb_path: str) -> List[str]:
         """List vars configuration files on USB (vars, vars.example, *.vars).
@@ -228,10 +447,7 @@ class USBFileManager:
         Returns:
             List of file paths
         """
-        found = set()
-        for pattern in ('vars', 'vars.example', '*.vars'):
-            found.update(self.list_files(usb_path, pattern))
-        return sorted(found)
+        return self.scan_drive(usb_path)['vars']
 
     def get_file_info(self, file_path: str) -> dict:
         """Get file information.
@@ -242,17 +458,17 @@ class USBFileManager:
         Returns:
             Dictionary with file information
         """
-        info = {
+        # One stat answers existence, size and mtime together; the
+        # exists-then-stat chain stats the same path three times
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stat = None
+
+        return {
             'path': file_path,
             'name': os.path.basename(file_path),
-            'exists': os.path.exists(file_path),
-            'size': 0,
-            'modified': None
+            'exists': stat is not None,
+            'size': stat.st_size if stat else 0,
+            'modified': stat.st_mtime if stat else None
         }
-
-        if os.path.exists(file_path):
-            stat = os.stat(file_path)
-            info['size'] = stat.st_size
-            info['modified'] = stat.st_mtime
-
-        return info
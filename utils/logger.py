@@ -1,9 +1,10 @@
 """Logging utilities for Easy-RSA PyTk."""
 
 import logging
+import logging.handlers
 import os
+import time
 from pathlib import Path
-from datetime import datetime
 from config.settings import settings
 
 
@@ -46,8 +47,15 @@ def setup_logger(name: str = 'easy-rsa-pytk') -> logging.Logger:
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(log_level)
+            # delay=True postpones opening the file until the first
+            # record actually written to it; rotation caps the log at
+            # ~4 MB total so it never fills the Pi's SD card
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=1_000_000, backupCount=3, delay=True
+            )
+            # Keep DEBUG chatter (per-command output dumps) off the SD
+            # card even when the console level is lowered
+            file_handler.setLevel(max(log_level, logging.INFO))
 
             file_format = logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
@@ -57,7 +65,7 @@ def setup_logger(name: str = 'easy-rsa-pytk') -> logging.Logger:
             logger.addHandler(file_handler)
 
         except (PermissionError, OSError) as e:
-            logger.warning(f'Could not create file log handler: {e}')
+            logger.warning('Could not create file log handler: %s', e)
 
     return logger
 
@@ -65,6 +73,15 @@ def setup_logger(name: str = 'easy-rsa-pytk') -> logging.Logger:
 # Global logger instance
 logger = setup_logger()
 
+# Level-name dispatch resolved once; log_operation runs in hot paths
+# and a dict lookup beats a getattr string lookup per call
+_LEVEL_FNS = {
+    'debug': logger.debug,
+    'info': logger.info,
+    'warning': logger.warning,
+    'error': logger.error,
+}
+
 
 def log_operation(operation: str, details: str = '', level: str = 'INFO'):
     """Log an operation.
@@ -74,13 +91,14 @@ def log_operation(operation: str, details: str = '', level: str = 'INFO'):
         details: Operation details
         level: Log level (DEBUG, INFO, WARNING, ERROR)
     """
-    log_func = getattr(logger, level.lower(), logger.info)
-    message = f'{operation}'
+    # Lazy %s formatting: the message is only built if the record
+    # passes the level filter
+    log_func = _LEVEL_FNS.get(level.lower(), logger.info)
 
     if details:
-        message += f': {details}'
-
-    log_func(message)
+        log_func('%s: %s', operation, details)
+    else:
+        log_func('%s', operation)
 
 
 def log_error(error: Exception, context: str = ''):
@@ -90,8 +108,8 @@ def log_error(error: Exception, context: str = ''):
         error: Exception object
         context: Error context
     """
-    message = f'Error in {context}: {type(error).__name__}: {str(error)}'
-    logger.error(message, exc_info=True)
+    logger.error('Error in %s: %s: %s', context, type(error).__name__, error,
+                 exc_info=error)
 
 
 def log_command(command: str, result: bool, output: str = ''):
@@ -103,10 +121,10 @@ def log_command(command: str, result: bool, output: str = ''):
         output: Command output
     """
     status = 'SUCCESS' if result else 'FAILED'
-    logger.info(f'Command {status}: {command}')
+    logger.info('Command %s: %s', status, command)
 
     if output and not result:
-        logger.debug(f'Command output: {output}')
+        logger.debug('Command output: %s', output)
 
 
 class OperationLogger:
@@ -123,8 +141,9 @@ class OperationLogger:
 
     def __enter__(self):
         """Enter context."""
-        self.start_time = datetime.now()
-        logger.info(f'Starting operation: {self.operation}')
+        # Monotonic: immune to NTP steps, which the Pi sees at boot
+        self.start_time = time.monotonic_ns()
+        logger.info('Starting operation: %s', self.operation)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -135,11 +154,12 @@ class OperationLogger:
             exc_val: Exception value
             exc_tb: Exception traceback
         """
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration = (time.monotonic_ns() - self.start_time) / 1e9
 
         if exc_type is None:
-            logger.info(f'Completed operation: {self.operation} ({duration:.2f}s)')
+            logger.info('Completed operation: %s (%.2fs)', self.operation, duration)
         else:
-            logger.error(f'Failed operation: {self.operation} ({duration:.2f}s): {exc_val}')
+            logger.error('Failed operation: %s (%.2fs): %s',
+                         self.operation, duration, exc_val)
 
         return False  # Don't suppress exceptions